@@ -67,6 +67,22 @@ MaskArray: TypeAlias = npt.NDArray[np.float64]
 TensorLike: TypeAlias = torch.Tensor | NDArrayFloat
 
 
+class _PinnedStaging:
+    """Page-locked host slots used to issue non-blocking host-to-device copies."""
+
+    def __init__(self, slots: int, shape: Sequence[int]):
+        self.host = torch.empty((slots, *shape), dtype=torch.float32, pin_memory=True)
+        self._copied = torch.cuda.Event()
+
+    def copy_to(self, sources: Sequence[TensorLike], targets: Sequence[torch.Tensor]) -> None:
+        # The previous DMA must have drained before the host slots are overwritten.
+        self._copied.synchronize()
+        for slot, (source, target) in enumerate(zip(sources, targets)):
+            self.host[slot].copy_(torch.as_tensor(source))
+            target.copy_(self.host[slot], non_blocking=True)
+        self._copied.record()
+
+
 class ReplayBuffer:
     """Fixed-size replay memory storing transition tuples."""
 
@@ -83,6 +99,7 @@ class ReplayBuffer:
 
         self.position = 0
         self.size = 0
+        self._staging = _PinnedStaging(2, self.state_shape) if device.type == "cuda" else None
 
     def __len__(self) -> int:
         return self.size
@@ -96,8 +113,11 @@ class ReplayBuffer:
         done: bool,
     ) -> None:
         idx = self.position
-        self.states[idx] = self._to_tensor(state)
-        self.next_states[idx] = self._to_tensor(next_state)
+        if self._staging is not None and not self._on_device(state, next_state):
+            self._staging.copy_to((state, next_state), (self.states[idx], self.next_states[idx]))
+        else:
+            self.states[idx] = self._to_tensor(state)
+            self.next_states[idx] = self._to_tensor(next_state)
         self.actions[idx] = int(action)
         self.rewards[idx] = float(reward)
         self.dones[idx] = float(done)
@@ -123,6 +143,10 @@ class ReplayBuffer:
         tensor = array.detach() if isinstance(array, torch.Tensor) else torch.from_numpy(array)
         return tensor.to(self.device, dtype=torch.float32)
 
+    @staticmethod
+    def _on_device(*arrays: TensorLike) -> bool:
+        return any(isinstance(a, torch.Tensor) and a.device.type != "cpu" for a in arrays)
+
 
 @dataclass
 class AgentConfig:
@@ -166,6 +190,18 @@ class DQNAgent:
 
         self.epsilon = self.config.epsilon_start
         self.train_steps = 0
+
+        # Optimisation steps run on a side stream on CUDA and return their loss without a
+        # host sync. The host still waits for each update at the next select_action
+        # (its argmax is read back with .item()), so environment steps are not hidden
+        # behind the update; what is saved is the per-step loss read-back.
+        self.compute_stream: torch.cuda.Stream | None = None
+        self._update_event: torch.cuda.Event | None = None
+        self._state_staging: _PinnedStaging | None = None
+        if self.device.type == "cuda":
+            self.compute_stream = torch.cuda.Stream(device=self.device)
+            self._update_event = torch.cuda.Event()
+            self._state_staging = _PinnedStaging(1, (obs_channels, 10, 10))
         logger.info(
             "agent_initialised",
             extra={
@@ -187,12 +223,38 @@ class DQNAgent:
         if training and random.random() < self.epsilon:
             return random.choice(legal)
 
+        self._wait_for_update()
         with torch.no_grad():
             q_values = self.policy_net(state_tensor)["q_values"].squeeze(0)
             masked_q = self._apply_action_mask(q_values, legal)
             action = int(torch.argmax(masked_q).item())
         return action
 
+    def select_action_batch(
+        self,
+        states: TensorLike,
+        legal_masks: npt.NDArray[np.generic] | None = None,
+        training: bool = True,
+    ) -> npt.NDArray[np.int64]:
+        """Pick one action per row of a batched observation with a single forward pass."""
+        state_tensor = self._prepare_state(states)
+        masks = None if legal_masks is None else np.asarray(legal_masks)[:, : self.num_actions]
+
+        self._wait_for_update()
+        with torch.no_grad():
+            q_values = self.policy_net(state_tensor)["q_values"]
+            if masks is not None:
+                legal = torch.as_tensor(masks != 0, device=self.device)
+                q_values = q_values.masked_fill(~legal, -1e9)
+            actions: npt.NDArray[np.int64] = torch.argmax(q_values, dim=1).cpu().numpy()
+
+        if training and self.epsilon > 0:
+            for row in range(actions.shape[0]):
+                if random.random() < self.epsilon:
+                    legal_row = self._legal_actions(None if masks is None else masks[row])
+                    actions[row] = random.choice(legal_row)
+        return actions
+
     def store_transition(
         self,
         state: TensorLike,
@@ -201,12 +263,43 @@ class DQNAgent:
         next_state: TensorLike,
         done: bool,
     ) -> None:
+        self._wait_for_update()
         self.replay_buffer.push(state, action, reward, next_state, done)
 
     def train_step(self) -> float | None:
-        if len(self.replay_buffer) < self.config.min_buffer_size:
+        loss = self._schedule_update()
+        if loss is None:
             return None
+        self._wait_for_update()
+        return float(loss.item())
+
+    def train_step_async(self) -> torch.Tensor | None:
+        """Schedule one optimisation step and return the loss without syncing the host.
+
+        On CUDA the update is enqueued on ``compute_stream``; weight reads and replay
+        buffer writes issued afterwards wait for it on the device, not on the host.
+        """
+        return self._schedule_update()
 
+    def sync(self) -> None:
+        """Order the current stream after any in-flight update, e.g. before reading losses."""
+        self._wait_for_update()
+
+    def _schedule_update(self) -> torch.Tensor | None:
+        if len(self.replay_buffer) < self.config.min_buffer_size:
+            return None
+        if self.compute_stream is None or self._update_event is None:
+            return self._optimise()
+
+        main_stream = torch.cuda.current_stream(self.device)
+        self.compute_stream.wait_stream(main_stream)
+        with torch.cuda.stream(self.compute_stream):
+            loss = self._optimise()
+            self._update_event.record(self.compute_stream)
+        loss.record_stream(main_stream)
+        return loss
+
+    def _optimise(self) -> torch.Tensor:
         states, actions, rewards, next_states, dones = self.replay_buffer.sample(
             self.config.batch_size
         )
@@ -230,12 +323,13 @@ class DQNAgent:
         if self.train_steps % self.config.target_update_interval == 0:
             self.target_net.load_state_dict(self.policy_net.state_dict())
 
-        return float(loss_tensor.item())
+        return loss_tensor.detach()
 
     def decay_epsilon(self) -> None:
         self.epsilon = max(self.config.epsilon_end, self.epsilon * self.config.epsilon_decay)
 
     def save(self, path: str | Path) -> None:
+        self._wait_for_update()
         payload = {
             "model_state": self.policy_net.state_dict(),
             "config": asdict(self.config),
@@ -246,6 +340,7 @@ class DQNAgent:
 
     def load(self, path: str | Path) -> None:
         payload = torch.load(Path(path), map_location=self.device)
+        self._wait_for_update()
         self.policy_net.load_state_dict(payload["model_state"])
         self.target_net.load_state_dict(payload["model_state"])
         if "config" in payload:
@@ -254,7 +349,21 @@ class DQNAgent:
             self.epsilon = float(payload["epsilon"])
         logger.info("agent_checkpoint_loaded", extra={"path": str(path)})
 
+    def _wait_for_update(self) -> None:
+        """Order the current stream after any in-flight optimisation step."""
+        if self._update_event is not None:
+            torch.cuda.current_stream(self.device).wait_event(self._update_event)
+
     def _prepare_state(self, state: TensorLike) -> torch.Tensor:
+        staging = self._state_staging
+        if (
+            staging is not None
+            and not isinstance(state, torch.Tensor)
+            and state.shape == staging.host.shape[1:]
+        ):
+            target = torch.empty(staging.host.shape, dtype=torch.float32, device=self.device)
+            staging.copy_to((state,), (target[0],))
+            return target
         tensor = state.detach() if isinstance(state, torch.Tensor) else torch.from_numpy(state)
         if tensor.ndim == 3:
             tensor = tensor.unsqueeze(0)
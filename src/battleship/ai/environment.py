@@ -32,10 +32,11 @@ if TYPE_CHECKING:  # pragma: no cover - typing-only shim
 else:
     GymnasiumEnv = Env
 
+from battleship.engine._engine_numba import CELL_HIT, CELL_UNKNOWN
 from battleship.engine.board import Board, CellState
 from battleship.engine.instrumented_game import InstrumentedBattleshipGame
 from battleship.engine.game import GamePhase, Player
-from battleship.engine.ship import Coordinate, Orientation, Ship, ShipType
+from battleship.engine.ship import CELL_COORDINATES, Coordinate, Orientation, Ship, ShipType
 from battleship.telemetry import (
     get_logger as get_otel_logger,
     get_tracer as get_otel_tracer,
@@ -466,7 +467,7 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
             for r in range(BOARD_SIZE):
                 line = [f"{r:>2} "]
                 for c in range(BOARD_SIZE):
-                    coord = Coordinate(r, c)
+                    coord = CELL_COORDINATES[r * BOARD_SIZE + c]
                     cell = board.get_cell_state(coord)
                     symbol = "."
                     if cell is CellState.HIT:
@@ -523,17 +524,10 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
         return self._action_to_coord(action_idx)
 
     def _legal_shot_mask_for_player(self, player: Player) -> ActionMask:
-        mask: ActionMask = np.zeros(NUM_CELLS, dtype=np.int8)
         if self.game is None:
-            return mask
-        target_board = self.game.boards[player.opponent()]
-        idx = 0
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                coord = Coordinate(row, col)
-                if target_board.get_cell_state(coord) is CellState.UNKNOWN:
-                    mask[idx] = 1
-                idx += 1
+            return np.zeros(NUM_CELLS, dtype=np.int8)
+        shot_grid = self.game.boards[player.opponent()].shot_grid
+        mask: ActionMask = (shot_grid.ravel() == CELL_UNKNOWN).astype(np.int8)
         return mask
 
     def _random_action_from_mask(self, mask: ActionMask) -> int:
@@ -556,7 +550,7 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
             for orientation_idx, orientation in enumerate(ORIENTATIONS):
                 for row in range(BOARD_SIZE):
                     for col in range(BOARD_SIZE):
-                        coord = Coordinate(row, col)
+                        coord = CELL_COORDINATES[row * BOARD_SIZE + col]
                         ship = Ship(ship_type, coord, orientation)
                         if board.can_place_ship(ship):
                             action_idx = self._placement_indices(ship_idx, orientation_idx, coord)
@@ -680,10 +674,9 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
                 if player_board.get_cell_state(coord) is CellState.HIT:
                     obs[1, coord.row, coord.col] = 1.0
 
-        for coord, state in opponent_board.shots.items():
-            obs[2, coord.row, coord.col] = 1.0
-            if state is CellState.HIT:
-                obs[3, coord.row, coord.col] = 1.0
+        shot_grid = opponent_board.shot_grid
+        obs[2] = shot_grid != CELL_UNKNOWN
+        obs[3] = shot_grid == CELL_HIT
 
         last_enemy_shot = (
             self.last_opponent_shot if player is Player.PLAYER1 else self.last_player_shot
@@ -724,11 +717,13 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
 
     @staticmethod
     def _action_to_coord(action: int) -> Coordinate:
+        if 0 <= action < NUM_CELLS:
+            return CELL_COORDINATES[action]
         return Coordinate(action // BOARD_SIZE, action % BOARD_SIZE)
 
     def _decode_action(self, action: int) -> Coordinate | PlacementAction:
         if action < NUM_CELLS:
-            return Coordinate(action // BOARD_SIZE, action % BOARD_SIZE)
+            return self._action_to_coord(action)
         if not (self.allow_agent_placement or self.allow_opponent_placement):
             raise ValueError("Placement actions unavailable in this mode.")
         placement_idx = action - NUM_CELLS
@@ -740,8 +735,7 @@ class BattleshipEnv(GymnasiumEnv[NDArrayFloat, int]):
         cell_idx = remainder % NUM_CELLS
         ship_type = SHIP_TYPES[ship_block]
         orientation = ORIENTATIONS[orientation_idx]
-        coord = Coordinate(cell_idx // BOARD_SIZE, cell_idx % BOARD_SIZE)
-        return PlacementAction(ship_type, coord, orientation)
+        return PlacementAction(ship_type, CELL_COORDINATES[cell_idx], orientation)
 
     def _placement_indices(self, ship_idx: int, orientation_idx: int, coord: Coordinate) -> int:
         base = NUM_CELLS + ship_idx * PLACEMENT_PER_SHIP
@@ -43,6 +43,7 @@ class InstrumentedDQNAgent(DQNAgent):
                 action = random.choice(legal)
                 exploratory = True
             else:
+                self._wait_for_update()
                 with torch.no_grad():
                     q_values = self.policy_net(state_tensor)["q_values"].squeeze(0)
                     masked_q = self._apply_action_mask(q_values, legal)
@@ -64,7 +65,7 @@ class InstrumentedDQNAgent(DQNAgent):
             span.set_attribute("exploratory", exploratory)
             span.set_attribute("action", action)
             record_game_metric("battleship_agent_epsilon", self.epsilon)
-            self._logger.info(
+            self._logger.debug(
                 "select_action epsilon=%.3f action=%s exploratory=%s",
                 self.epsilon,
                 action,
@@ -72,6 +73,30 @@ class InstrumentedDQNAgent(DQNAgent):
             )
             return action
 
+    def select_action_batch(
+        self,
+        states: StateLike,
+        legal_masks: npt.NDArray[np.generic] | None = None,
+        training: bool = True,
+    ) -> npt.NDArray[np.int64]:
+        start = time.perf_counter()
+        with self._tracer.start_as_current_span("battleship.agent.select_action_batch") as span:
+            actions = super().select_action_batch(states, legal_masks, training=training)
+            duration_ms = (time.perf_counter() - start) * 1000
+            record_game_metric(
+                "battleship_agent_actions_total",
+                len(actions),
+                {"mode": "batch"},
+            )
+            record_game_metric(
+                "battleship_agent_action_latency_ms",
+                duration_ms,
+                {"mode": "batch"},
+            )
+            span.set_attribute("epsilon", self.epsilon)
+            span.set_attribute("batch_size", len(actions))
+            return actions
+
     def train_step(self) -> float | None:
         start = time.perf_counter()
         with self._tracer.start_as_current_span("battleship.agent.train_step") as span:
@@ -84,5 +109,16 @@ class InstrumentedDQNAgent(DQNAgent):
             if loss is not None:
                 record_game_metric("battleship_agent_training_loss", loss)
                 span.set_attribute("loss", loss)
-                self._logger.info("train_step loss=%.4f", loss)
+                self._logger.debug("train_step loss=%.4f", loss)
             return loss
+
+    def train_step_async(self) -> torch.Tensor | None:
+        # Called once per env step by the trainer: metrics only, the episode span
+        # carries the aggregate view.
+        start = time.perf_counter()
+        loss = super().train_step_async()
+        if loss is not None:
+            duration_ms = (time.perf_counter() - start) * 1000
+            record_game_metric("battleship_agent_training_steps_total", 1)
+            record_game_metric("battleship_agent_training_latency_ms", duration_ms)
+        return loss
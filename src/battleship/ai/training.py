@@ -6,11 +6,15 @@ import argparse
 import json
 import logging
 import os
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import gymnasium as gym
 import numpy as np
+import torch
+from gymnasium.vector import SyncVectorEnv
 from opentelemetry.instrumentation.logging import LoggingInstrumentor
 
 from battleship.ai.agent import AgentConfig, DQNAgent
@@ -49,6 +53,11 @@ class TrainingConfig:
     opponent_manual_placement: bool = False
     rollout_episodes: int = 0
     rollout_path: str = "policy_rollouts.jsonl"
+    log_interval: int = 10
+
+    def __post_init__(self) -> None:
+        if self.log_interval < 1:
+            raise ValueError("log_interval must be at least 1.")
 
 
 class Trainer:
@@ -115,6 +124,7 @@ class Trainer:
         self.eval_history: list[dict[str, float]] = []
         self.rollout_history: list[dict[str, Any]] = []
         self._initialise_opponent_agent(obs_channels=obs_channels, agent_config=agent_config)
+        self.eval_envs: SyncVectorEnv | None = self._build_eval_envs()
 
     def _configure_telemetry(self) -> None:
         endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
@@ -158,6 +168,30 @@ class Trainer:
             if self.config.opponent_manual_placement:
                 self.env.opponent_placement_policy = self._opponent_policy_wrapper
 
+    def _build_eval_envs(self) -> SyncVectorEnv | None:
+        """Create one environment per evaluation episode so they can be stepped in lockstep."""
+
+        if self.config.eval_episodes <= 0:
+            return None
+
+        def make_env(offset: int) -> Callable[[], gym.Env[Any, Any]]:
+            def factory() -> gym.Env[Any, Any]:
+                seed = None if self.config.env_seed is None else self.config.env_seed + offset
+                env = BattleshipEnv(
+                    rng_seed=seed,
+                    allow_opponent_placement=self.config.opponent_manual_placement,
+                )
+                if self.opponent_agent is not None:
+                    env.opponent_policy = self._opponent_policy_wrapper
+                    if self.config.opponent_manual_placement:
+                        env.opponent_placement_policy = self._opponent_policy_wrapper
+                # BattleshipEnv only subclasses a typing shim of gym.Env under mypy.
+                return cast(gym.Env[Any, Any], env)
+
+            return factory
+
+        return SyncVectorEnv([make_env(idx + 1) for idx in range(self.config.eval_episodes)])
+
     def _opponent_policy_wrapper(self, obs: np.ndarray, info: dict[str, Any]) -> int:
         if self.opponent_agent is None:
             raise RuntimeError("Opponent agent not initialised.")
@@ -168,7 +202,7 @@ class Trainer:
         with self.tracer.start_as_current_span("train_episode") as span:
             obs, info = self.env.reset()
             total_reward = 0.0
-            losses: list[float] = []
+            losses: list[torch.Tensor] = []
 
             step = -1
             for step in range(self.config.max_steps_per_episode):
@@ -178,7 +212,10 @@ class Trainer:
                 done = terminated or truncated
 
                 self.agent.store_transition(obs, action, reward, next_obs, done)
-                loss = self.agent.train_step()
+                # The update samples a buffer that already holds this transition. On CUDA
+                # it runs on the agent's compute stream; losses stay on device until the
+                # episode ends instead of being read back every step.
+                loss = self.agent.train_step_async()
                 if loss is not None:
                     losses.append(loss)
                 self.agent.decay_epsilon()
@@ -188,7 +225,9 @@ class Trainer:
                 if done:
                     break
 
-            mean_loss = float(np.mean(losses)) if losses else 0.0
+            # The losses were written on the compute stream; order this read after them.
+            self.agent.sync()
+            mean_loss = float(torch.stack(losses).mean().item()) if losses else 0.0
             step_count = step + 1 if step >= 0 else 0
             metrics = {
                 "reward": total_reward,
@@ -207,16 +246,17 @@ class Trainer:
             self.episode_rewards.append(total_reward)
             self.episode_losses.append(mean_loss)
 
-            logger.info(
-                "train_episode",
-                extra={
-                    "episode_index": episode_index,
-                    "reward": total_reward,
-                    "steps": step_count,
-                    "mean_loss": mean_loss,
-                    "epsilon": self.agent.epsilon,
-                },
-            )
+            if episode_index % self.config.log_interval == 0:
+                logger.info(
+                    "train_episode",
+                    extra={
+                        "episode_index": episode_index,
+                        "reward": total_reward,
+                        "steps": step_count,
+                        "mean_loss": mean_loss,
+                        "epsilon": self.agent.epsilon,
+                    },
+                )
             return metrics
 
     def _evaluate(self) -> dict[str, float]:
@@ -232,19 +272,26 @@ class Trainer:
                 if opponent_cached is not None:
                     self.opponent_agent.epsilon = 0.0
 
-            for _ in range(self.config.eval_episodes):
-                obs, info = self.env.reset()
-                episode_reward = 0.0
+            if self.eval_envs is not None:
+                eval_envs = self.eval_envs
+                obs, info = eval_envs.reset()
+                episode_rewards = np.zeros(eval_envs.num_envs, dtype=np.float64)
+                active = np.ones(eval_envs.num_envs, dtype=bool)
                 for step in range(self.config.max_steps_per_episode):
-                    action = self.agent.select_action(obs, info.get("action_mask"), training=False)
-                    obs, reward, terminated, truncated, info = self.env.step(action)
-                    episode_reward += reward
-                    if terminated or truncated:
-                        if info.get("winner") == "PLAYER1":
+                    masks = np.stack(info["action_mask"])
+                    actions = self.agent.select_action_batch(obs, masks, training=False)
+                    obs, reward, terminated, truncated, info = eval_envs.step(actions)
+                    episode_rewards += np.where(active, reward, 0.0)
+                    # Finished envs auto-reset; their last info lives under "final_info".
+                    finished = active & (terminated | truncated)
+                    for idx in np.flatnonzero(finished):
+                        if info["final_info"][idx].get("winner") == "PLAYER1":
                             wins += 1
                         lengths.append(step + 1)
+                    active &= ~finished
+                    if not active.any():
                         break
-                rewards.append(episode_reward)
+                rewards = episode_rewards.tolist()
 
             self.agent.epsilon = cached_epsilon
             if (
@@ -293,26 +340,25 @@ class Trainer:
             if opponent_cached is not None:
                 self.opponent_agent.epsilon = 0.0
 
+        max_steps = self.config.max_steps_per_episode
         for episode in range(1, total_episodes + 1):
             obs, info = self.env.reset()
-            trajectory: list[dict[str, Any]] = []
+            # Columnar buffers, filled by step index and serialised once per episode.
+            actions = np.empty(max_steps, dtype=np.int32)
+            rewards = np.empty(max_steps, dtype=np.float64)
+            phases: list[str | None] = [None] * max_steps
             total_reward = 0.0
             steps = 0
             terminated_flag = False
             truncated_flag = False
 
-            for _ in range(self.config.max_steps_per_episode):
+            for _ in range(max_steps):
                 mask = info.get("action_mask")
                 action = self.agent.select_action(obs, mask, training=False)
                 obs, reward, terminated, truncated, info = self.env.step(action)
-                trajectory.append(
-                    {
-                        "step": steps,
-                        "action": action,
-                        "reward": reward,
-                        "phase": info.get("phase"),
-                    }
-                )
+                actions[steps] = action
+                rewards[steps] = reward
+                phases[steps] = info.get("phase")
                 total_reward += reward
                 steps += 1
                 terminated_flag = terminated
@@ -327,7 +373,11 @@ class Trainer:
                 "winner": info.get("winner"),
                 "terminated": terminated_flag,
                 "truncated": truncated_flag,
-                "trajectory": trajectory,
+                "trajectory": {
+                    "action": actions[:steps].tolist(),
+                    "reward": rewards[:steps].tolist(),
+                    "phase": phases[:steps],
+                },
             }
             results.append(summary)
 
@@ -348,6 +398,12 @@ class Trainer:
         self.rollout_history.extend(results)
         return results
 
+    def close(self) -> None:
+        """Release the training and evaluation environments."""
+        self.env.close()
+        if self.eval_envs is not None:
+            self.eval_envs.close()
+
     def _save_metrics(self) -> None:
         payload = {
             "config": asdict(self.config),
@@ -407,33 +463,36 @@ def main() -> None:
     )
     trainer = Trainer(config)
 
-    for episode in range(1, config.num_episodes + 1):
-        metrics = trainer._train_episode(episode)
-        print(
-            f"[Episode {episode}/{config.num_episodes}] "
-            f"reward={metrics['reward']:.2f} steps={metrics['steps']:.0f} "
-            f"loss={metrics['mean_loss']:.4f} epsilon={metrics['epsilon']:.3f}"
-        )
-
-        if episode % config.eval_interval == 0:
-            eval_metrics = trainer._evaluate()
+    try:
+        for episode in range(1, config.num_episodes + 1):
+            metrics = trainer._train_episode(episode)
             print(
-                f"  Eval -> mean_reward={eval_metrics['mean_reward']:.2f} "
-                f"win_rate={eval_metrics['win_rate']:.2%} "
-                f"avg_length={eval_metrics['avg_length']:.1f}"
+                f"[Episode {episode}/{config.num_episodes}] "
+                f"reward={metrics['reward']:.2f} steps={metrics['steps']:.0f} "
+                f"loss={metrics['mean_loss']:.4f} epsilon={metrics['epsilon']:.3f}"
             )
-            checkpoint = Path(config.save_dir) / f"checkpoint_ep{episode}.pt"
-            trainer.agent.save(checkpoint)
-            trainer._save_metrics()
-            if config.rollout_episodes > 0:
-                rollout_file = Path(config.save_dir) / config.rollout_path
-                rollouts = trainer._policy_rollout(output_path=rollout_file)
-                display_path = (
-                    rollout_file.relative_to(Path.cwd())
-                    if rollout_file.is_absolute()
-                    else rollout_file
+
+            if episode % config.eval_interval == 0:
+                eval_metrics = trainer._evaluate()
+                print(
+                    f"  Eval -> mean_reward={eval_metrics['mean_reward']:.2f} "
+                    f"win_rate={eval_metrics['win_rate']:.2%} "
+                    f"avg_length={eval_metrics['avg_length']:.1f}"
                 )
-                print(f"  Rollout -> recorded {len(rollouts)} episodes to {display_path}")
+                checkpoint = Path(config.save_dir) / f"checkpoint_ep{episode}.pt"
+                trainer.agent.save(checkpoint)
+                trainer._save_metrics()
+                if config.rollout_episodes > 0:
+                    rollout_file = Path(config.save_dir) / config.rollout_path
+                    rollouts = trainer._policy_rollout(output_path=rollout_file)
+                    display_path = (
+                        rollout_file.relative_to(Path.cwd())
+                        if rollout_file.is_absolute()
+                        else rollout_file
+                    )
+                    print(f"  Rollout -> recorded {len(rollouts)} episodes to {display_path}")
+    finally:
+        trainer.close()
 
 
 if __name__ == "__main__":
@@ -106,8 +106,7 @@ def _prompt_orientation(ship_type: ShipType) -> Orientation:
 
 
 def _manual_ship_placement(board: Board) -> None:
-    board.ships.clear()
-    board.shots.clear()
+    board.reset()
     for ship_type in ShipType:
         while True:
             print("\nCurrent layout:")
@@ -0,0 +1,225 @@
+"""Numeric inner kernels for the Battleship engine.
+
+The kernels operate on preallocated NumPy arrays so they can be compiled with
+numba when it is installed. Without numba they run as plain Python functions
+with identical results.
+
+Board cells are indexed ``row * BOARD_SIZE + col``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+try:  # pragma: no cover - exercised only when numba is installed
+    from numba import njit as _numba_njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def _jit(func: _F) -> _F:
+    """Compile ``func`` with numba when available, otherwise return it unchanged."""
+    if _numba_njit is None:
+        return func
+    compiled: _F = _numba_njit(cache=True, fastmath=False, boundscheck=False)(func)
+    return compiled
+
+
+BOARD_SIZE = 10
+
+# Codes stored in the shot grid; also returned as shot outcomes.
+CELL_UNKNOWN = 0
+CELL_MISS = 1
+CELL_HIT = 2
+
+# Orientation codes used in placement records.
+HORIZONTAL = 0
+VERTICAL = 1
+
+_SHIFT_13 = np.uint64(13)
+_SHIFT_7 = np.uint64(7)
+_SHIFT_17 = np.uint64(17)
+
+
+@_jit
+def _next_random(rng_state: npt.NDArray[np.uint64]) -> np.uint64:
+    """Advance a xorshift64 generator stored in ``rng_state[0]``."""
+    x: np.uint64 = rng_state[0]
+    x ^= x << _SHIFT_13
+    x ^= x >> _SHIFT_7
+    x ^= x << _SHIFT_17
+    rng_state[0] = x
+    return x
+
+
+@_jit
+def _receive_shot_nb(
+    grid: npt.NDArray[np.uint8],
+    cell_to_ship: npt.NDArray[np.int8],
+    ship_hits: npt.NDArray[np.uint8],
+    row: int,
+    col: int,
+) -> tuple[int, int]:
+    """Apply a shot and return ``(outcome, ship_index)``.
+
+    ``cell_to_ship`` maps each cell index to the ship occupying it (-1 when empty)
+    and ``ship_hits`` counts hits per ship. ``outcome`` is ``CELL_UNKNOWN`` when the
+    cell was already targeted (nothing is updated), otherwise ``CELL_MISS`` or
+    ``CELL_HIT``. ``ship_index`` is -1 unless a ship was hit.
+    """
+    if grid[row, col] != CELL_UNKNOWN:
+        return CELL_UNKNOWN, -1
+    idx = int(cell_to_ship[row * BOARD_SIZE + col])
+    if idx < 0:
+        grid[row, col] = CELL_MISS
+        return CELL_MISS, -1
+    ship_hits[idx] += 1
+    grid[row, col] = CELL_HIT
+    return CELL_HIT, idx
+
+
+@_jit
+def _valid_moves_nb(
+    grid: npt.NDArray[np.uint8],
+    out_rows: npt.NDArray[np.int64],
+    out_cols: npt.NDArray[np.int64],
+) -> int:
+    """Write every untargeted cell into ``out_rows``/``out_cols`` and return the count."""
+    count = 0
+    for row in range(grid.shape[0]):
+        for col in range(grid.shape[1]):
+            if grid[row, col] == CELL_UNKNOWN:
+                out_rows[count] = row
+                out_cols[count] = col
+                count += 1
+    return count
+
+
+@_jit
+def _random_placement_nb(
+    placements: npt.NDArray[np.int64],
+    lengths: npt.NDArray[np.int64],
+    allow_adjacent: bool,
+    rng_state: npt.NDArray[np.uint64],
+) -> None:
+    """Rejection-sample a legal layout for ships of the given ``lengths``.
+
+    Fills ``placements[i]`` with ``(orientation, row, col)`` for ship ``i``.
+    """
+    occupied = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=np.uint8)
+    for idx in range(lengths.shape[0]):
+        length = lengths[idx]
+        while True:
+            orientation = int(_next_random(rng_state) % np.uint64(2))
+            span = BOARD_SIZE - length + 1
+            if orientation == HORIZONTAL:
+                row = int(_next_random(rng_state) % np.uint64(BOARD_SIZE))
+                col = int(_next_random(rng_state) % np.uint64(span))
+                d_row, d_col = 0, 1
+            else:
+                row = int(_next_random(rng_state) % np.uint64(span))
+                col = int(_next_random(rng_state) % np.uint64(BOARD_SIZE))
+                d_row, d_col = 1, 0
+
+            legal = True
+            for offset in range(length):
+                r = row + offset * d_row
+                c = col + offset * d_col
+                if occupied[r, c]:
+                    legal = False
+                    break
+                if not allow_adjacent:
+                    for n_row in range(max(r - 1, 0), min(r + 2, BOARD_SIZE)):
+                        for n_col in range(max(c - 1, 0), min(c + 2, BOARD_SIZE)):
+                            if occupied[n_row, n_col]:
+                                legal = False
+                    if not legal:
+                        break
+            if legal:
+                break
+
+        for offset in range(length):
+            occupied[row + offset * d_row, col + offset * d_col] = 1
+        placements[idx, 0] = orientation
+        placements[idx, 1] = row
+        placements[idx, 2] = col
+
+
+@_jit
+def _reset_batch_nb(
+    grids: npt.NDArray[np.uint8],
+    cell_to_ship: npt.NDArray[np.int8],
+    ship_hits: npt.NDArray[np.uint8],
+    cells_left: npt.NDArray[np.int64],
+    current: npt.NDArray[np.int8],
+    winners: npt.NDArray[np.int8],
+    lengths: npt.NDArray[np.int64],
+    allow_adjacent: bool,
+    rng_state: npt.NDArray[np.uint64],
+) -> None:
+    """Clear every game in a batch and deal both players a random fleet."""
+    n_ships = lengths.shape[0]
+    placements = np.zeros((n_ships, 3), dtype=np.int64)
+    for game in range(grids.shape[0]):
+        for player in range(2):
+            _random_placement_nb(placements, lengths, allow_adjacent, rng_state)
+            grids[game, player] = CELL_UNKNOWN
+            cell_to_ship[game, player] = -1
+            ship_hits[game, player] = 0
+            for idx in range(n_ships):
+                d_row, d_col = (0, 1) if placements[idx, 0] == HORIZONTAL else (1, 0)
+                for offset in range(lengths[idx]):
+                    row = placements[idx, 1] + offset * d_row
+                    col = placements[idx, 2] + offset * d_col
+                    cell_to_ship[game, player, row * BOARD_SIZE + col] = idx
+            cells_left[game, player] = lengths.sum()
+        current[game] = 0
+        winners[game] = -1
+
+
+@_jit
+def _make_move_batch_nb(
+    grids: npt.NDArray[np.uint8],
+    cell_to_ship: npt.NDArray[np.int8],
+    ship_hits: npt.NDArray[np.uint8],
+    cells_left: npt.NDArray[np.int64],
+    current: npt.NDArray[np.int8],
+    winners: npt.NDArray[np.int8],
+    moves: npt.NDArray[np.int64],
+    outcomes: npt.NDArray[np.int8],
+) -> None:
+    """Fire ``moves[g]`` (a cell index) for the player to move in every game ``g``.
+
+    ``outcomes[g]`` receives the shot outcome code, ``CELL_UNKNOWN`` for an already
+    targeted cell (the turn does not pass), or -1 when game ``g`` had already been
+    won. A hit that clears the last ship cell records the shooter in ``winners``.
+    """
+    for game in range(moves.shape[0]):
+        if winners[game] >= 0:
+            outcomes[game] = -1
+            continue
+        player = current[game]
+        target = 1 - player
+        row = moves[game] // BOARD_SIZE
+        col = moves[game] % BOARD_SIZE
+        outcome, _ = _receive_shot_nb(
+            grids[game, target], cell_to_ship[game, target], ship_hits[game, target], row, col
+        )
+        outcomes[game] = outcome
+        if outcome == CELL_UNKNOWN:
+            continue
+        if outcome == CELL_HIT:
+            cells_left[game, target] -= 1
+            if cells_left[game, target] == 0:
+                winners[game] = player
+                continue
+        current[game] = target
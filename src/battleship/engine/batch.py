@@ -0,0 +1,108 @@
+"""Many independent Battleship games stepped together for bulk self-play."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import numpy.typing as npt
+
+from ._engine_numba import BOARD_SIZE, CELL_UNKNOWN, _make_move_batch_nb, _reset_batch_nb
+from .game import Player
+from .ship import ShipType
+
+_PLAYERS = (Player.PLAYER1, Player.PLAYER2)
+_FLEET_LENGTHS = np.array([ship_type.value for ship_type in ShipType], dtype=np.int64)
+
+
+class GameBatch:
+    """Array-backed batch of two-player games driven by the compiled move kernel.
+
+    Each game follows ``BattleshipGame`` rules (random fleets, alternating turns, a
+    repeated cell keeps the turn) but state lives in stacked arrays, so a whole
+    batch advances with one kernel call instead of one ``make_move`` per game.
+    Players are indexed 0/1 in ``PLAYER1``/``PLAYER2`` order and moves are cell
+    indices ``row * 10 + col``.
+    """
+
+    def __init__(self, size: int, rng_seed: int | None = None, allow_adjacent: bool = True) -> None:
+        if size <= 0:
+            raise ValueError("Batch size must be positive.")
+        self.size = size
+        self.allow_adjacent = allow_adjacent
+        self._rng = random.Random(rng_seed)
+        n_cells = BOARD_SIZE * BOARD_SIZE
+        self._grids = np.zeros((size, 2, BOARD_SIZE, BOARD_SIZE), dtype=np.uint8)
+        self._cell_to_ship = np.full((size, 2, n_cells), -1, dtype=np.int8)
+        self._ship_hits = np.zeros((size, 2, len(_FLEET_LENGTHS)), dtype=np.uint8)
+        self._cells_left = np.zeros((size, 2), dtype=np.int64)
+        self._current = np.zeros(size, dtype=np.int8)
+        self._winners = np.full(size, -1, dtype=np.int8)
+        self._outcomes = np.zeros(size, dtype=np.int8)
+        self.reset()
+
+    def reset(self) -> None:
+        """Deal fresh random fleets to every game and give the first turn to player 1."""
+        # xorshift state must be non-zero.
+        rng_state = np.array([self._rng.getrandbits(64) | 1], dtype=np.uint64)
+        _reset_batch_nb(
+            self._grids,
+            self._cell_to_ship,
+            self._ship_hits,
+            self._cells_left,
+            self._current,
+            self._winners,
+            _FLEET_LENGTHS,
+            self.allow_adjacent,
+            rng_state,
+        )
+
+    def step(self, moves: npt.ArrayLike) -> npt.NDArray[np.int8]:
+        """Fire one shot per game for the player to move and return the outcome codes.
+
+        Outcomes are ``CELL_MISS``/``CELL_HIT``, ``CELL_UNKNOWN`` when the cell had
+        already been targeted, or -1 for games that were already finished. The
+        returned array is reused by the next call.
+        """
+        move_array = np.asarray(moves, dtype=np.int64)
+        if move_array.shape != (self.size,):
+            raise ValueError(f"Expected {self.size} moves, got shape {move_array.shape}.")
+        if ((move_array < 0) | (move_array >= BOARD_SIZE * BOARD_SIZE)).any():
+            raise ValueError("Shot out of bounds.")
+        _make_move_batch_nb(
+            self._grids,
+            self._cell_to_ship,
+            self._ship_hits,
+            self._cells_left,
+            self._current,
+            self._winners,
+            move_array,
+            self._outcomes,
+        )
+        return self._outcomes
+
+    def legal_moves_mask(self) -> npt.NDArray[np.bool_]:
+        """Return a ``(size, 100)`` mask of untargeted cells for each player to move."""
+        games = np.arange(self.size)
+        target_grids = self._grids[games, 1 - self._current.astype(np.int64)]
+        mask: npt.NDArray[np.bool_] = target_grids.reshape(self.size, -1) == CELL_UNKNOWN
+        return mask
+
+    @property
+    def current_players(self) -> npt.NDArray[np.int8]:
+        """Index of the player to move in each game."""
+        return self._current
+
+    @property
+    def winners(self) -> npt.NDArray[np.int8]:
+        """Index of each game's winner, or -1 while it is still in progress."""
+        return self._winners
+
+    def done(self) -> bool:
+        """Return True once every game in the batch has a winner."""
+        return bool((self._winners >= 0).all())
+
+    def winner(self, game: int) -> Player | None:
+        """Return the winner of one game as a ``Player``."""
+        index = int(self._winners[game])
+        return _PLAYERS[index] if index >= 0 else None
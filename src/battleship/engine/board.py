@@ -3,30 +3,86 @@
 from __future__ import annotations
 
 import logging
+import os
 import random
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
-from battleship.telemetry import get_meter, get_tracer
+import numpy as np
+import numpy.typing as npt
 
-from .ship import Coordinate, Orientation, Ship, ShipType
+from battleship.telemetry import get_meter
+
+from ._engine_numba import (
+    BOARD_SIZE,
+    CELL_HIT,
+    CELL_UNKNOWN,
+    NUMBA_AVAILABLE,
+    _random_placement_nb,
+    _receive_shot_nb,
+    _valid_moves_nb,
+)
+from .ship import (
+    CELL_COORDINATES,
+    SHIP_MASK_TABLE,
+    CellIndex,
+    Coordinate,
+    Orientation,
+    Ship,
+    ShipLayoutKey,
+    ShipType,
+    cell_index,
+)
 
 logger = logging.getLogger(__name__)
-tracer = get_tracer("battleship.engine.board")
 meter = get_meter("battleship.engine.board")
 
-PLACEMENT_COUNTER = meter.create_counter(
-    "battleship_engine_ship_placements",
-    unit="1",
-    description="Number of attempted ship placements",
+# Engine counters are skipped entirely with ``BATTLESHIP_TELEMETRY=0`` (bulk simulation);
+# spans are emitted by ``InstrumentedBattleshipGame`` rather than the engine itself.
+ENGINE_TELEMETRY_ENABLED = os.getenv("BATTLESHIP_TELEMETRY", "1") != "0"
+
+PLACEMENT_COUNTER = (
+    meter.create_counter(
+        "battleship_engine_ship_placements",
+        unit="1",
+        description="Number of attempted ship placements",
+    )
+    if ENGINE_TELEMETRY_ENABLED
+    else None
 )
 
-SHOT_COUNTER = meter.create_counter(
-    "battleship_engine_shots",
-    unit="1",
-    description="Shots received by a board",
+SHOT_COUNTER = (
+    meter.create_counter(
+        "battleship_engine_shots",
+        unit="1",
+        description="Shots received by a board",
+    )
+    if ENGINE_TELEMETRY_ENABLED
+    else None
 )
 
+# Bitboard layout: cell (row, col) maps to bit ``row * BOARD_SIZE + col`` of a Python int.
+_FULL_MASK = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+_COL0_MASK = sum(1 << (row * BOARD_SIZE) for row in range(BOARD_SIZE))
+_NOT_COL0 = _FULL_MASK & ~_COL0_MASK
+_NOT_LAST_COL = _FULL_MASK & ~(_COL0_MASK << (BOARD_SIZE - 1))
+
+
+def _dilate(mask: int) -> int:
+    """Grow a bitboard by one cell in all eight directions, clipped to the board."""
+    # Horizontal shifts must not wrap from one row's edge into the next row.
+    row_spread = mask | ((mask << 1) & _NOT_COL0) | ((mask >> 1) & _NOT_LAST_COL)
+    return (row_spread | (row_spread << BOARD_SIZE) | (row_spread >> BOARD_SIZE)) & _FULL_MASK
+
+
+# One-cell halo around every on-board placement (ship cells included). A candidate
+# touches the fleet exactly when its halo overlaps the occupancy bitboard.
+_HALO_TABLE: dict[ShipLayoutKey, int] = {
+    key: _dilate(layout[0]) for key, layout in SHIP_MASK_TABLE.items() if layout is not None
+}
+
 
 class CellState(Enum):
     """State of a board cell from the perspective of shots taken."""
@@ -36,15 +92,79 @@ class CellState(Enum):
     HIT = "hit"
 
 
-@dataclass
+_CELL_STATES = (CellState.UNKNOWN, CellState.MISS, CellState.HIT)
+
+
+@dataclass(frozen=True, slots=True)
+class BoardSnapshot:
+    """Serializable view of a board for state queries."""
+
+    ships: tuple[tuple[Coordinate, ...], ...]
+    shots: dict[Coordinate, CellState]
+
+
+# Fleet and orientation lookups reused by every random placement; orientations are
+# indexed by the placement kernel's ``HORIZONTAL``/``VERTICAL`` codes.
+_SHIP_TYPES = tuple(ShipType)
+_SHIP_LENGTHS = np.array([ship_type.value for ship_type in _SHIP_TYPES], dtype=np.int64)
+_ORIENTATIONS = (Orientation.HORIZONTAL, Orientation.VERTICAL)
+
+
+@dataclass(slots=True)
 class Board:
     """Represents a player's 10×10 board and fleet of ships."""
 
     size: int = 10
     ships: list[Ship] = field(default_factory=list)
-    shots: dict[Coordinate, CellState] = field(default_factory=dict)
     allow_adjacent: bool = True
     owner: str = "unknown"
+    _grid: npt.NDArray[np.uint8] = field(init=False, repr=False)
+    _occupied: int = field(default=0, init=False, repr=False)
+    _hits: int = field(default=0, init=False, repr=False)
+    # Cell index -> index into ``ships`` (-1 when empty), and hits landed per ship.
+    _cell_to_ship: npt.NDArray[np.int8] = field(init=False, repr=False)
+    _ship_hits: npt.NDArray[np.uint8] = field(init=False, repr=False)
+    _state_dirty: bool = field(default=True, init=False, repr=False)
+    _last_snapshot: BoardSnapshot | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.size != BOARD_SIZE:
+            raise ValueError(f"Only {BOARD_SIZE}x{BOARD_SIZE} boards are supported.")
+        self._grid = np.zeros((self.size, self.size), dtype=np.uint8)
+        self._cell_to_ship = np.full(self.size * self.size, -1, dtype=np.int8)
+        self._ship_hits = np.zeros(0, dtype=np.uint8)
+        ships, self.ships = self.ships, []
+        for ship in ships:
+            self._add_ship(ship)
+
+    @property
+    def shot_grid(self) -> npt.NDArray[np.uint8]:
+        """Shot outcomes per cell (``CELL_UNKNOWN``/``CELL_MISS``/``CELL_HIT``); read-only."""
+        return self._grid
+
+    @property
+    def shots(self) -> Mapping[Coordinate, CellState]:
+        """Targeted cells and their outcomes, rebuilt from the shot grid; read-only.
+
+        Record shots with ``receive_shot``/``apply_shot`` and clear them with ``reset``.
+        """
+        return MappingProxyType(self._shot_map())
+
+    def _shot_map(self) -> dict[Coordinate, CellState]:
+        states = self._grid.ravel()
+        return {
+            CELL_COORDINATES[cell]: _CELL_STATES[states[cell]] for cell in np.flatnonzero(states)
+        }
+
+    def snapshot(self) -> BoardSnapshot:
+        """Return a view of ships and shots, rebuilt only after the board changes."""
+        if self._state_dirty or self._last_snapshot is None:
+            self._last_snapshot = BoardSnapshot(
+                ships=tuple(ship.coordinates() for ship in self.ships),
+                shots=self._shot_map(),
+            )
+            self._state_dirty = False
+        return self._last_snapshot
 
     def is_valid_coordinate(self, coord: Coordinate) -> bool:
         """Check whether a coordinate lies inside the board boundaries."""
@@ -52,50 +172,17 @@ class Board:
 
     def can_place_ship(self, ship: Ship) -> bool:
         """Determine whether a ship can be placed without violating rules."""
-        coords = ship.coordinates()
-        if not all(self.is_valid_coordinate(coord) for coord in coords):
-            return False
-
-        for existing in self.ships:
-            if ship.overlaps(existing):
-                return False
-
-        if not self.allow_adjacent:
-            occupied = self._occupied_coordinates()
-            forbidden = self._adjacent_coordinates(occupied)
-            if any(coord in forbidden for coord in coords):
-                return False
-
-        return True
+        return self._placement_error(ship) is None
 
     def place_ship(self, ship: Ship) -> None:
         """Add ship to the board or raise when placement violates rules."""
-        with tracer.start_as_current_span("board.place_ship") as span:
-            span.set_attribute("ship.type", ship.ship_type.name)
-            span.set_attribute("ship.length", ship.ship_type.length)
-            span.set_attribute("ship.start.row", ship.start.row)
-            span.set_attribute("ship.start.col", ship.start.col)
-            span.set_attribute("board.owner", self.owner)
-            try:
-                self._ensure_placeable(ship)
-            except ValueError as exc:
-                span.record_exception(exc)
+        try:
+            self._ensure_placeable(ship)
+        except ValueError:
+            if PLACEMENT_COUNTER is not None:
                 PLACEMENT_COUNTER.add(1, attributes={"result": "failed", "owner": self.owner})
-                logger.warning(
-                    "ship_placement_failed",
-                    extra={
-                        "owner": self.owner,
-                        "ship_type": ship.ship_type.name,
-                        "orientation": ship.orientation.name,
-                        "row": ship.start.row,
-                        "col": ship.start.col,
-                    },
-                )
-                raise
-            self.ships.append(ship)
-            PLACEMENT_COUNTER.add(1, attributes={"result": "success", "owner": self.owner})
-            logger.info(
-                "ship_placed",
+            logger.warning(
+                "ship_placement_failed",
                 extra={
                     "owner": self.owner,
                     "ship_type": ship.ship_type.name,
@@ -104,116 +191,170 @@ class Board:
                     "col": ship.start.col,
                 },
             )
+            raise
+        self._add_ship(ship)
+        if PLACEMENT_COUNTER is not None:
+            PLACEMENT_COUNTER.add(1, attributes={"result": "success", "owner": self.owner})
+        logger.info(
+            "ship_placed",
+            extra={
+                "owner": self.owner,
+                "ship_type": ship.ship_type.name,
+                "orientation": ship.orientation.name,
+                "row": ship.start.row,
+                "col": ship.start.col,
+            },
+        )
 
-    def receive_shot(self, coord: Coordinate) -> tuple[CellState, Ship | None]:
+    def receive_shot(self, target: Coordinate | CellIndex) -> tuple[CellState, Ship | None]:
         """Register a shot at this board and return its outcome."""
-        with tracer.start_as_current_span("board.receive_shot") as span:
-            span.set_attribute("shot.row", coord.row)
-            span.set_attribute("shot.col", coord.col)
-            span.set_attribute("board.owner", self.owner)
-            if not self.is_valid_coordinate(coord):
-                logger.error(
-                    "shot_out_of_bounds",
-                    extra={"row": coord.row, "col": coord.col, "owner": self.owner},
-                )
-                raise ValueError("Shot out of bounds.")
-            if coord in self.shots:
-                logger.error(
-                    "shot_duplicate",
-                    extra={"row": coord.row, "col": coord.col, "owner": self.owner},
-                )
-                raise ValueError("Cell has already been targeted.")
-
-            for ship in self.ships:
-                if ship.hit(coord):
-                    self.shots[coord] = CellState.HIT
-                    span.set_attribute("shot.outcome", "hit")
-                    SHOT_COUNTER.add(1, attributes={"outcome": "hit", "owner": self.owner})
-                    logger.info(
-                        "shot_hit",
-                        extra={
-                            "row": coord.row,
-                            "col": coord.col,
-                            "ship_type": ship.ship_type.name,
-                            "owner": self.owner,
-                        },
-                    )
-                    return CellState.HIT, ship
-
-            self.shots[coord] = CellState.MISS
-            span.set_attribute("shot.outcome", "miss")
-            SHOT_COUNTER.add(1, attributes={"outcome": "miss", "owner": self.owner})
+        cell = cell_index(target)
+        if not 0 <= cell < self.size * self.size:
+            if isinstance(target, Coordinate):
+                row, col = target.row, target.col
+            else:
+                row, col = divmod(cell, self.size)
+            logger.error(
+                "shot_out_of_bounds",
+                extra={"row": row, "col": col, "owner": self.owner},
+            )
+            raise ValueError("Shot out of bounds.")
+        row, col = divmod(cell, self.size)
+        if self._grid[row, col] != CELL_UNKNOWN:
+            logger.error(
+                "shot_duplicate",
+                extra={"row": row, "col": col, "owner": self.owner},
+            )
+            raise ValueError("Cell has already been targeted.")
+
+        ship = self.apply_shot(cell)
+        if ship is not None:
+            if SHOT_COUNTER is not None:
+                SHOT_COUNTER.add(1, attributes={"outcome": "hit", "owner": self.owner})
             logger.info(
-                "shot_miss", extra={"row": coord.row, "col": coord.col, "owner": self.owner}
+                "shot_hit",
+                extra={
+                    "row": row,
+                    "col": col,
+                    "ship_type": ship.ship_type.name,
+                    "owner": self.owner,
+                },
             )
-            return CellState.MISS, None
+            return CellState.HIT, ship
+
+        if SHOT_COUNTER is not None:
+            SHOT_COUNTER.add(1, attributes={"outcome": "miss", "owner": self.owner})
+        logger.info("shot_miss", extra={"row": row, "col": col, "owner": self.owner})
+        return CellState.MISS, None
+
+    def apply_shot(self, cell: CellIndex) -> Ship | None:
+        """Record a shot at an untargeted cell and return the ship hit, if any.
 
-    def get_cell_state(self, coord: Coordinate) -> CellState:
+        The fast path behind ``receive_shot``, for bulk self-play: it skips logging
+        and metrics. The bounds check stays because the shot kernel indexes the grid
+        without one.
+        """
+        # NumPy integers (e.g. from valid_moves_array) would overflow the hit bitboard.
+        cell = int(cell)
+        if not 0 <= cell < self.size * self.size:
+            raise ValueError("Shot out of bounds.")
+        row, col = divmod(cell, self.size)
+        outcome, ship_idx = _receive_shot_nb(
+            self._grid, self._cell_to_ship, self._ship_hits, row, col
+        )
+        if outcome == CELL_UNKNOWN:
+            raise ValueError("Cell has already been targeted.")
+        self._state_dirty = True
+        if outcome != CELL_HIT:
+            return None
+        self._hits |= 1 << cell
+        ship = self.ships[ship_idx]
+        ship.hit(cell)
+        return ship
+
+    def get_cell_state(self, target: Coordinate | CellIndex) -> CellState:
         """Return the state of a cell after shots have been taken."""
-        return self.shots.get(coord, CellState.UNKNOWN)
+        cell = cell_index(target)
+        if not 0 <= cell < self.size * self.size:
+            return CellState.UNKNOWN
+        return _CELL_STATES[self._grid.item(cell)]
+
+    def unknown_cells(self) -> npt.NDArray[np.int32]:
+        """Return the cell indices that have not been targeted yet, in ascending order."""
+        if NUMBA_AVAILABLE:
+            rows = np.empty(self._grid.size, dtype=np.int64)
+            cols = np.empty(self._grid.size, dtype=np.int64)
+            count = _valid_moves_nb(self._grid, rows, cols)
+            return (rows[:count] * self.size + cols[:count]).astype(np.int32)
+        return np.flatnonzero(self._grid == CELL_UNKNOWN).astype(np.int32)
+
+    def unknown_coordinates(self) -> list[Coordinate]:
+        """Return every cell that has not been targeted yet, in row-major order."""
+        return [CELL_COORDINATES[cell] for cell in self.unknown_cells().tolist()]
 
     def all_ships_sunk(self) -> bool:
         """Check whether the player has any surviving ships."""
-        return all(ship.is_sunk() for ship in self.ships)
+        # Hits are only ever recorded on occupied cells, so equal popcounts mean all are hit.
+        return self._hits.bit_count() == self._occupied.bit_count()
 
     def random_placement(self, rng: random.Random) -> None:
         """Randomly place one ship of each type on the board."""
-        with tracer.start_as_current_span("board.random_placement") as span:
-            span.set_attribute("board.owner", self.owner)
-            self.ships.clear()
-            self.shots.clear()
-            for ship_type in ShipType:
-                placed = False
-                attempts = 0
-                while not placed:
-                    orientation = rng.choice(list(Orientation))
-                    start_row = rng.randrange(self.size)
-                    start_col = rng.randrange(self.size)
-                    candidate = Ship(ship_type, Coordinate(start_row, start_col), orientation)
-                    try:
-                        self.place_ship(candidate)
-                    except ValueError:
-                        attempts += 1
-                        continue
-                    placed = True
-                    attempts += 1
-                logger.debug(
-                    "random_ship_placed",
-                    extra={"ship_type": ship_type.name, "attempts": attempts, "owner": self.owner},
-                )
-
-    def _occupied_coordinates(self) -> set[Coordinate]:
-        coords: set[Coordinate] = set()
-        for ship in self.ships:
-            coords.update(ship.coordinates())
-        return coords
-
-    def _adjacent_coordinates(self, coords: set[Coordinate]) -> set[Coordinate]:
-        """Return the 8-neighbourhood (plus the cell itself) for each coordinate."""
-        adjacent: set[Coordinate] = set(coords)
-        for coord in coords:
-            for delta_row in (-1, 0, 1):
-                for delta_col in (-1, 0, 1):
-                    if delta_row == 0 and delta_col == 0:
-                        continue
-                    neighbour = Coordinate(coord.row + delta_row, coord.col + delta_col)
-                    if not self.is_valid_coordinate(neighbour):
-                        continue
-                    adjacent.add(neighbour)
-        return adjacent
+        self.reset()
+        # Without numba the same kernel runs as plain Python and consumes the same
+        # xorshift stream, so a seed deals the same fleet either way.
+        placements = np.zeros((len(_SHIP_TYPES), 3), dtype=np.int64)
+        # xorshift state must be non-zero.
+        rng_state = np.array([rng.getrandbits(64) | 1], dtype=np.uint64)
+        _random_placement_nb(placements, _SHIP_LENGTHS, self.allow_adjacent, rng_state)
+        for ship_type, (orientation, row, col) in zip(_SHIP_TYPES, placements.tolist()):
+            start = CELL_COORDINATES[row * BOARD_SIZE + col]
+            self._add_ship(Ship(ship_type, start, _ORIENTATIONS[orientation]))
+            if PLACEMENT_COUNTER is not None:
+                PLACEMENT_COUNTER.add(1, attributes={"result": "success", "owner": self.owner})
+            logger.debug(
+                "random_ship_placed",
+                extra={"ship_type": ship_type.name, "owner": self.owner},
+            )
 
-    def _ensure_placeable(self, ship: Ship) -> None:
-        """Raise ValueError when a placement violates board rules."""
-        coords = ship.coordinates()
-        if not all(self.is_valid_coordinate(coord) for coord in coords):
+    def reset(self) -> None:
+        """Remove every ship and shot, keeping the board's rules and owner.
+
+        Use this rather than clearing ``ships`` directly, which would leave the
+        occupancy bitboard and shot grid out of sync.
+        """
+        self.ships.clear()
+        self._grid.fill(CELL_UNKNOWN)
+        self._cell_to_ship.fill(-1)
+        self._ship_hits = self._ship_hits[:0]
+        self._occupied = self._hits = 0
+        self._state_dirty = True
+
+    def _add_ship(self, ship: Ship) -> None:
+        if ship.layout_key() not in _HALO_TABLE:
             raise ValueError("Ship placement out of bounds.")
+        for cell in ship.cells():
+            self._cell_to_ship[cell] = len(self.ships)
+        self.ships.append(ship)
+        self._occupied |= ship.mask
+        self._ship_hits = np.append(self._ship_hits, np.uint8(0))
+        self._state_dirty = True
+
+    def _placement_error(self, ship: Ship) -> str | None:
+        """Return why a placement violates board rules, or None when it is legal."""
+        halo = _HALO_TABLE.get(ship.layout_key())
+        if halo is None:
+            return "Ship placement out of bounds."
+
+        if ship.mask & self._occupied:
+            return "Ship placement overlaps an existing ship."
 
-        for existing in self.ships:
-            if ship.overlaps(existing):
-                raise ValueError("Ship placement overlaps an existing ship.")
+        if not self.allow_adjacent and halo & self._occupied:
+            return "Ship placement violates adjacency rules."
 
-        if not self.allow_adjacent:
-            occupied = self._occupied_coordinates()
-            forbidden = self._adjacent_coordinates(occupied)
-            if any(coord in forbidden for coord in coords):
-                raise ValueError("Ship placement violates adjacency rules.")
+        return None
+
+    def _ensure_placeable(self, ship: Ship) -> None:
+        """Raise ValueError when a placement violates board rules."""
+        error = self._placement_error(ship)
+        if error is not None:
+            raise ValueError(error)
@@ -4,22 +4,29 @@ from __future__ import annotations
 
 import logging
 import random
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 
-from battleship.telemetry import get_meter, get_tracer
+import numpy as np
+import numpy.typing as npt
 
-from .board import Board, CellState
-from .ship import Coordinate, Ship
+from battleship.telemetry import get_meter
+
+from .board import ENGINE_TELEMETRY_ENABLED, Board, BoardSnapshot, CellState
+from .ship import CellIndex, Coordinate, Ship
 
 logger = logging.getLogger(__name__)
-tracer = get_tracer("battleship.engine.game")
 meter = get_meter("battleship.engine.game")
 
-MOVE_COUNTER = meter.create_counter(
-    "battleship_engine_moves",
-    unit="1",
-    description="Number of moves made in BattleshipGame",
+MOVE_COUNTER = (
+    meter.create_counter(
+        "battleship_engine_moves",
+        unit="1",
+        description="Number of moves made in BattleshipGame",
+    )
+    if ENGINE_TELEMETRY_ENABLED
+    else None
 )
 
 
@@ -39,18 +46,25 @@ class Player(Enum):
 
     def opponent(self) -> Player:
         """Return the opposing player."""
-        return Player.PLAYER2 if self is Player.PLAYER1 else Player.PLAYER1
+        return _OPPONENT[self]
 
 
-@dataclass(frozen=True)
-class BoardSnapshot:
-    """Serializable view of a board for state queries."""
+_OPPONENT = {Player.PLAYER1: Player.PLAYER2, Player.PLAYER2: Player.PLAYER1}
 
-    ships: tuple[tuple[Coordinate, ...], ...]
-    shots: dict[Coordinate, CellState]
+# Phase and turn are packed into one int: bit 0 holds the player to move, bits 1-2 the phase.
+_PHASES = tuple(GamePhase)
+_PLAYERS = tuple(Player)
+_PHASE_BITS = {phase: index << 1 for index, phase in enumerate(_PHASES)}
+_PLAYER_BITS = {player: index for index, player in enumerate(_PLAYERS)}
+_PLAYER_MASK = 1
+_FINISHED_STATE = _PHASE_BITS[GamePhase.FINISHED]
+# State in which ``make_move`` accepts a shot from each player.
+_EXPECTED_STATE = {
+    player: _PHASE_BITS[GamePhase.IN_PROGRESS] | bit for player, bit in _PLAYER_BITS.items()
+}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Immutable snapshot of the current game."""
 
@@ -60,6 +74,10 @@ class GameState:
     boards: dict[Player, BoardSnapshot]
 
 
+# Picks the next cell index to fire at given the target board's shot grid.
+ShotPolicy = Callable[[npt.NDArray[np.uint8]], CellIndex]
+
+
 class BattleshipGame:
     """Coordinates gameplay between two player boards."""
 
@@ -68,71 +86,109 @@ class BattleshipGame:
             Player.PLAYER1: Board(owner=Player.PLAYER1.value),
             Player.PLAYER2: Board(owner=Player.PLAYER2.value),
         }
-        self.phase: GamePhase = GamePhase.SETUP
-        self.current_player: Player = Player.PLAYER1
+        self._state = _PHASE_BITS[GamePhase.SETUP] | _PLAYER_BITS[Player.PLAYER1]
         self.winner: Player | None = None
         self._rng = random.Random(rng_seed)
 
+    @property
+    def phase(self) -> GamePhase:
+        """Current lifecycle phase."""
+        return _PHASES[self._state >> 1]
+
+    @phase.setter
+    def phase(self, phase: GamePhase) -> None:
+        self._state = _PHASE_BITS[phase] | (self._state & _PLAYER_MASK)
+
+    @property
+    def current_player(self) -> Player:
+        """Player whose turn it is."""
+        return _PLAYERS[self._state & _PLAYER_MASK]
+
+    @current_player.setter
+    def current_player(self, player: Player) -> None:
+        self._state = (self._state & ~_PLAYER_MASK) | _PLAYER_BITS[player]
+
     def setup_random(self) -> None:
         """Randomly place fleets for both players and start the game."""
-        with tracer.start_as_current_span("game.setup_random"):
-            for player, board in self.boards.items():
-                board.random_placement(self._rng)
-                logger.debug("game_random_placement", extra={"board_owner": player.value})
-            self.phase = GamePhase.IN_PROGRESS
-            self.current_player = Player.PLAYER1
-            self.winner = None
+        for player, board in self.boards.items():
+            board.random_placement(self._rng)
+            logger.debug("game_random_placement", extra={"board_owner": player.value})
+        self._state = _EXPECTED_STATE[Player.PLAYER1]
+        self.winner = None
+        logger.info(
+            "game_setup_random_complete",
+            extra={"phase": self.phase.value, "current_player": self.current_player.value},
+        )
+
+    def make_move(
+        self, player: Player, coord: Coordinate | CellIndex
+    ) -> tuple[CellState, Ship | None]:
+        """Apply a single shot, enforcing turn order and win conditions.
+
+        ``coord`` may be a ``Coordinate`` or a packed cell index ``row * 10 + col``.
+        """
+        if self._state != _EXPECTED_STATE[player]:
+            self._reject_move(player)
+
+        target_board = self.boards[_OPPONENT[player]]
+        result = target_board.receive_shot(coord)
+
+        if target_board.all_ships_sunk():
+            self.winner = player
+            self._state = _FINISHED_STATE | _PLAYER_BITS[player]
             logger.info(
-                "game_setup_random_complete",
-                extra={"phase": self.phase.value, "current_player": self.current_player.value},
+                "game_finished",
+                extra={"winner": player.value, "finishing_player": player.value},
             )
+        else:
+            self._state ^= _PLAYER_MASK
 
-    def make_move(self, player: Player, coord: Coordinate) -> tuple[CellState, Ship | None]:
-        """Apply a single shot, enforcing turn order and win conditions."""
-        with tracer.start_as_current_span("game.make_move") as span:
-            span.set_attribute("player", player.value)
-            span.set_attribute("row", coord.row)
-            span.set_attribute("col", coord.col)
-            if self.phase is not GamePhase.IN_PROGRESS:
-                logger.error(
-                    "move_rejected_game_not_in_progress",
-                    extra={"player": player.value, "phase": self.phase.value},
-                )
-                raise RuntimeError("Game is not in progress.")
-            if player is not self.current_player:
-                logger.error(
-                    "move_rejected_wrong_player",
-                    extra={"player": player.value, "current": self.current_player.value},
-                )
-                raise RuntimeError("It is not this player's turn.")
-
-            target_board = self.boards[player.opponent()]
-            result = target_board.receive_shot(coord)
-
-            if target_board.all_ships_sunk():
-                self.winner = player
-                self.phase = GamePhase.FINISHED
-                span.set_attribute("game.winner", player.value)
-                logger.info(
-                    "game_finished",
-                    extra={"winner": player.value, "finishing_player": player.value},
-                )
-            else:
-                self.current_player = player.opponent()
-                span.set_attribute("next_player", self.current_player.value)
-
+        if MOVE_COUNTER is not None:
             MOVE_COUNTER.add(1, attributes={"result": result[0].value, "player": player.value})
-            return result
+        return result
+
+    def _reject_move(self, player: Player) -> None:
+        """Log and raise the reason ``player`` may not move in the current state."""
+        if self.phase is not GamePhase.IN_PROGRESS:
+            logger.error(
+                "move_rejected_game_not_in_progress",
+                extra={"player": player.value, "phase": self.phase.value},
+            )
+            raise RuntimeError("Game is not in progress.")
+        if player is not self.current_player:
+            logger.error(
+                "move_rejected_wrong_player",
+                extra={"player": player.value, "current": self.current_player.value},
+            )
+            raise RuntimeError("It is not this player's turn.")
+
+    def play_random_game(self, p1_policy: ShotPolicy, p2_policy: ShotPolicy) -> Player:
+        """Deal random fleets and play a whole game between two policies; return the winner.
+
+        Each policy receives the shot grid of the board it fires at (read-only) and must
+        return an untargeted cell index. Shots skip ``make_move``'s per-move checks,
+        logging and metrics; a policy that repeats a cell or returns one off the board
+        raises ``ValueError``.
+        """
+        self.setup_random()
+        policies = {Player.PLAYER1: p1_policy, Player.PLAYER2: p2_policy}
+        player = self.current_player
+        while True:
+            target_board = self.boards[_OPPONENT[player]]
+            cell = policies[player](target_board.shot_grid)
+            if target_board.apply_shot(cell) is not None and target_board.all_ships_sunk():
+                break
+            player = player.opponent()
+        self.winner = player
+        self._state = _FINISHED_STATE | _PLAYER_BITS[player]
+        logger.info(
+            "game_finished", extra={"winner": player.value, "finishing_player": player.value}
+        )
+        return player
 
     def get_state(self) -> GameState:
         """Return an immutable view of the current match."""
-        board_views = {
-            player: BoardSnapshot(
-                ships=tuple(tuple(ship.coordinates()) for ship in board.ships),
-                shots=dict(board.shots),
-            )
-            for player, board in self.boards.items()
-        }
+        board_views = {player: board.snapshot() for player, board in self.boards.items()}
         return GameState(
             phase=self.phase,
             current_player=self.current_player,
@@ -140,15 +196,18 @@ class BattleshipGame:
             boards=board_views,
         )
 
+    def valid_moves_array(self, player: Player) -> npt.NDArray[np.int32]:
+        """Return the cell indices the player can legally target as an int32 array."""
+        if self.phase is not GamePhase.IN_PROGRESS:
+            return np.empty(0, dtype=np.int32)
+        return self.boards[_OPPONENT[player]].unknown_cells()
+
     def valid_moves(self, player: Player) -> list[Coordinate]:
-        """Return all coordinates the player can legally target."""
+        """Return all coordinates the player can legally target.
+
+        Prefer ``valid_moves_array`` in hot loops; this wrapper boxes every cell as a
+        ``Coordinate``.
+        """
         if self.phase is not GamePhase.IN_PROGRESS:
             return []
-        target_board = self.boards[player.opponent()]
-        moves: list[Coordinate] = []
-        for row in range(target_board.size):
-            for col in range(target_board.size):
-                coord = Coordinate(row, col)
-                if target_board.get_cell_state(coord) is CellState.UNKNOWN:
-                    moves.append(coord)
-        return moves
+        return self.boards[_OPPONENT[player]].unknown_coordinates()
@@ -5,9 +5,12 @@ from __future__ import annotations
 import time
 from typing import Any
 
+import numpy as np
+
+from battleship.engine._engine_numba import BOARD_SIZE
 from battleship.engine.board import CellState
-from battleship.engine.game import BattleshipGame, GamePhase, Player
-from battleship.engine.ship import Coordinate, Ship
+from battleship.engine.game import BattleshipGame, GamePhase, Player, ShotPolicy
+from battleship.engine.ship import CellIndex, Coordinate, Ship
 from battleship.telemetry import get_logger, get_tracer, record_game_metric
 
 
@@ -40,12 +43,18 @@ class InstrumentedBattleshipGame(BattleshipGame):
             )
             self._logger.info("Random setup finished")
 
-    def make_move(self, player: Player, coord: Coordinate) -> tuple[CellState, Ship | None]:
+    def make_move(
+        self, player: Player, coord: Coordinate | CellIndex
+    ) -> tuple[CellState, Ship | None]:
+        if isinstance(coord, Coordinate):
+            row, col = coord.row, coord.col
+        else:
+            row, col = divmod(int(coord), BOARD_SIZE)
         with self._tracer.start_as_current_span("battleship.engine.make_move") as span:
             span.set_attribute("game.id", self._game_id_counter)
             span.set_attribute("player", player.name)
-            span.set_attribute("coord.row", coord.row)
-            span.set_attribute("coord.col", coord.col)
+            span.set_attribute("coord.row", row)
+            span.set_attribute("coord.col", col)
 
             try:
                 cell_state, ship = super().make_move(player, coord)
@@ -57,7 +66,7 @@ class InstrumentedBattleshipGame(BattleshipGame):
                 )
                 span.record_exception(exc)
                 span.set_attribute("error", True)
-                self._logger.error("Invalid move from %s at (%d,%d): %s", player.name, coord.row, coord.col, exc)
+                self._logger.error("Invalid move from %s at (%d,%d): %s", player.name, row, col, exc)
                 raise
 
             hit = cell_state is CellState.HIT
@@ -75,8 +84,8 @@ class InstrumentedBattleshipGame(BattleshipGame):
             self._logger.info(
                 "make_move player=%s coord=(%d,%d) outcome=%s",
                 player.name,
-                coord.row,
-                coord.col,
+                row,
+                col,
                 cell_state.name,
             )
 
@@ -86,6 +95,16 @@ class InstrumentedBattleshipGame(BattleshipGame):
 
             return cell_state, ship
 
+    def play_random_game(self, p1_policy: ShotPolicy, p2_policy: ShotPolicy) -> Player:
+        # The base loop bypasses make_move, so close the game span opened by setup_random here.
+        try:
+            winner = super().play_random_game(p1_policy, p2_policy)
+        except Exception:
+            self._close_game_span()
+            raise
+        self._finish_game()
+        return winner
+
     def _start_game_span(self) -> None:
         self._close_game_span()
         self._game_start_time = time.perf_counter()
@@ -96,7 +115,9 @@ class InstrumentedBattleshipGame(BattleshipGame):
 
     def _finish_game(self) -> None:
         duration = (time.perf_counter() - self._game_start_time) if self._game_start_time else 0.0
-        total_turns = sum(len(board.shots) for board in self.boards.values())
+        total_turns = sum(
+            int(np.count_nonzero(board.shot_grid)) for board in self.boards.values()
+        )
         winner = self.winner.name if self.winner else "unknown"
 
         record_game_metric(
@@ -4,16 +4,43 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple
 
+from ._engine_numba import BOARD_SIZE
 
-@dataclass(frozen=True)
-class Coordinate:
-    """Immutable board coordinate."""
+
+class Coordinate(NamedTuple):
+    """Immutable board coordinate.
+
+    A named tuple, so hashing and equality use tuple's C implementation.
+    """
 
     row: int
     col: int
 
 
+# Packed cell index ``row * BOARD_SIZE + col`` used inside the engine.
+CellIndex = int
+
+# One shared Coordinate per cell, so cell indices convert back without allocating.
+CELL_COORDINATES = tuple(
+    Coordinate(row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+)
+
+
+def cell_index(target: Coordinate | CellIndex) -> CellIndex:
+    """Pack a coordinate into a cell index; cell indices pass through unchanged.
+
+    Coordinates outside the board map to -1.
+    """
+    if isinstance(target, Coordinate):
+        if 0 <= target.row < BOARD_SIZE and 0 <= target.col < BOARD_SIZE:
+            return target.row * BOARD_SIZE + target.col
+        return -1
+    return int(target)
+
+
 class Orientation(Enum):
     """Allowed ship orientations."""
 
@@ -21,6 +48,10 @@ class Orientation(Enum):
     VERTICAL = "vertical"
 
 
+# (row, col) step between consecutive cells of a ship in each orientation.
+_DELTA = {Orientation.HORIZONTAL: (0, 1), Orientation.VERTICAL: (1, 0)}
+
+
 class ShipType(Enum):
     """All supported ship classes and their lengths."""
 
@@ -36,45 +67,123 @@ class ShipType(Enum):
         return self.value
 
 
-@dataclass
+ShipLayoutKey = tuple[ShipType, Orientation, int, int]
+
+
+ShipLayout = tuple[int, tuple[Coordinate, ...], tuple[CellIndex, ...]]
+
+
+def _build_ship_mask_table() -> dict[ShipLayoutKey, ShipLayout | None]:
+    table: dict[ShipLayoutKey, ShipLayout | None] = {}
+    for ship_type in ShipType:
+        length = ship_type.value
+        for orientation in Orientation:
+            d_row, d_col = _DELTA[orientation]
+            for row in range(BOARD_SIZE):
+                for col in range(BOARD_SIZE):
+                    end_row = row + d_row * (length - 1)
+                    end_col = col + d_col * (length - 1)
+                    if end_row >= BOARD_SIZE or end_col >= BOARD_SIZE:
+                        table[(ship_type, orientation, row, col)] = None
+                        continue
+                    cells = tuple(
+                        (row + d_row * offset) * BOARD_SIZE + col + d_col * offset
+                        for offset in range(length)
+                    )
+                    mask = 0
+                    for cell in cells:
+                        mask |= 1 << cell
+                    coords = tuple(CELL_COORDINATES[cell] for cell in cells)
+                    table[(ship_type, orientation, row, col)] = (mask, coords, cells)
+    return table
+
+
+# Bitboard mask, coordinates and cell indices for every placement whose start lies on the board;
+# ``None`` marks placements that run off the edge.
+SHIP_MASK_TABLE = _build_ship_mask_table()
+
+
+@lru_cache(maxsize=1024)
+def _off_board_layout(key: ShipLayoutKey) -> ShipLayout:
+    """Build the layout of a placement missing from ``SHIP_MASK_TABLE``.
+
+    Only on-board cells get a mask bit and off-board cells are stored as ``-1``; boards
+    reject such ships before placing them.
+    """
+    ship_type, orientation, row, col = key
+    d_row, d_col = _DELTA[orientation]
+    coords = tuple(
+        Coordinate(row + d_row * offset, col + d_col * offset) for offset in range(ship_type.value)
+    )
+    cells = tuple(cell_index(coord) for coord in coords)
+    mask = 0
+    for cell in cells:
+        if cell >= 0:
+            mask |= 1 << cell
+    return mask, coords, cells
+
+
+@dataclass(slots=True)
 class Ship:
-    """Represents a single ship instance on the board."""
+    """Represents a single ship instance on the board.
+
+    Occupied and hit cells are tracked as bitmasks over cell indices
+    ``row * 10 + col``.
+    """
 
     ship_type: ShipType
     start: Coordinate
     orientation: Orientation
-    hits: set[Coordinate] = field(init=False)
+    mask: int = field(init=False, repr=False)
+    hits_mask: int = field(init=False, default=0, repr=False)
+    _sunk: bool = field(init=False, default=False, repr=False)
     _coordinates: tuple[Coordinate, ...] = field(init=False, repr=False)
-    _coordinate_set: set[Coordinate] = field(init=False, repr=False)
+    _cells: tuple[CellIndex, ...] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.hits = set()
-        coords: list[Coordinate] = []
-        for offset in range(self.ship_type.length):
-            if self.orientation is Orientation.HORIZONTAL:
-                coords.append(Coordinate(self.start.row, self.start.col + offset))
-            else:
-                coords.append(Coordinate(self.start.row + offset, self.start.col))
-        self._coordinates = tuple(coords)
-        self._coordinate_set = set(coords)
-
-    def coordinates(self) -> list[Coordinate]:
-        """Return the ordered list of coordinates occupied by this ship."""
-        return list(self._coordinates)
+        key = self.layout_key()
+        layout = SHIP_MASK_TABLE.get(key) or _off_board_layout(key)
+        self.mask, self._coordinates, self._cells = layout
+
+    @property
+    def hits(self) -> set[Coordinate]:
+        """Coordinates of this ship that have been hit."""
+        return {
+            CELL_COORDINATES[cell]
+            for cell in self._cells
+            if cell >= 0 and self.hits_mask >> cell & 1
+        }
+
+    def layout_key(self) -> ShipLayoutKey:
+        """Return the ``SHIP_MASK_TABLE`` key describing this placement."""
+        return (self.ship_type, self.orientation, self.start.row, self.start.col)
+
+    def coordinates(self) -> tuple[Coordinate, ...]:
+        """Return the ordered coordinates occupied by this ship."""
+        return self._coordinates
+
+    def cells(self) -> tuple[CellIndex, ...]:
+        """Return the packed cell indices occupied by this ship, in order (``-1`` off-board)."""
+        return self._cells
 
     def is_sunk(self) -> bool:
         """Determine whether every coordinate belonging to the ship has been hit."""
-        return self._coordinate_set.issubset(self.hits)
+        return self._sunk
 
-    def hit(self, coord: Coordinate) -> bool:
-        """Record a hit if the coordinate belongs to this ship."""
-        if coord not in self._coordinate_set:
+    def hit(self, target: Coordinate | CellIndex) -> bool:
+        """Record a hit if the coordinate or cell index belongs to this ship."""
+        cell = cell_index(target)
+        if cell < 0:
+            return False
+        bit = 1 << cell
+        if not self.mask & bit:
             return False
-        if coord in self.hits:
+        if self.hits_mask & bit:
             return False
-        self.hits.add(coord)
+        self.hits_mask |= bit
+        self._sunk = self.hits_mask == self.mask
         return True
 
     def overlaps(self, other: Ship) -> bool:
         """Return True if any coordinate overlaps with another ship."""
-        return bool(self._coordinate_set & other._coordinate_set)
+        return bool(self.mask & other.mask)
@@ -1,13 +1,19 @@
-"""Public telemetry helpers for Battleship RL."""
+"""Public telemetry helpers for Battleship RL.
+
+Helpers are resolved lazily (PEP 562) so importing this package does not pull in
+the OpenTelemetry SDK or exporters until one of them is first used.
+"""
 
 from __future__ import annotations
 
-from .config import TelemetryConfig
-from .config import init_telemetry as _base_init_telemetry
-from .config import load_telemetry_config
-from .logger import get_logger, init_logging
-from .metrics import get_meter, init_metrics, record_game_metric
-from .tracer import get_tracer, init_tracing
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .config import TelemetryConfig, load_telemetry_config
+    from .logger import get_logger, init_logging
+    from .metrics import get_meter, init_metrics, record_game_metric
+    from .tracer import get_tracer, init_tracing
 
 __all__ = [
     "TelemetryConfig",
@@ -22,8 +28,36 @@ __all__ = [
     "init_telemetry",
 ]
 
+# Submodule providing each lazily exported name.
+_LAZY_EXPORTS = {
+    "TelemetryConfig": ".config",
+    "load_telemetry_config": ".config",
+    "get_logger": ".logger",
+    "init_logging": ".logger",
+    "get_meter": ".metrics",
+    "init_metrics": ".metrics",
+    "record_game_metric": ".metrics",
+    "get_tracer": ".tracer",
+    "init_tracing": ".tracer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 def init_telemetry(config: TelemetryConfig | None = None) -> TelemetryConfig:
     """Initialize tracing/metrics/logging based on the provided config."""
 
+    from .config import init_telemetry as _base_init_telemetry
+
     return _base_init_telemetry(config)
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+from functools import cache
 from typing import Any, Dict
 
 from pydantic import BaseModel, Field
 
+# Batch-processor settings shared by the span and log exporters, sized for self-play,
+# which can end a span or emit a log record per move.
+EXPORT_MAX_QUEUE_SIZE = 8192
+EXPORT_MAX_BATCH_SIZE = 1024
+EXPORT_SCHEDULE_DELAY_MILLIS = 2000
+
 
 class TelemetryConfig(BaseModel):
     """Runtime configuration for telemetry exporters."""
@@ -26,7 +32,11 @@ class TelemetryConfig(BaseModel):
     def from_env(cls, **overrides: Any) -> "TelemetryConfig":
         """Construct config from env vars (`BATTLESHIP_*` + `OTEL_*`)."""
 
-        data: Dict[str, Any] = cls().model_dump()
+        # Start from the field defaults directly so the model is only validated once, below.
+        data: Dict[str, Any] = {
+            name: field.get_default(call_default_factory=True)
+            for name, field in cls.model_fields.items()
+        }
         data.update(overrides)
 
         def _bool_from_env(*names: str) -> bool | None:
@@ -89,7 +99,8 @@ class TelemetryConfig(BaseModel):
         return cls(**data)
 
 
-@lru_cache(maxsize=1)
+# Environment is read once per process; call cache_clear() after changing OTEL_* variables.
+@cache
 def load_telemetry_config() -> TelemetryConfig:
     """Load and cache telemetry config from the environment."""
 
@@ -99,12 +110,14 @@ def load_telemetry_config() -> TelemetryConfig:
 def init_telemetry(config: TelemetryConfig | None = None) -> TelemetryConfig:
     """Initialise telemetry subsystems lazily."""
 
+    resolved = config or load_telemetry_config()
+    if not (resolved.enable_tracing or resolved.enable_metrics or resolved.enable_logging):
+        return resolved
+
     from .logger import init_logging
     from .metrics import init_metrics
     from .tracer import init_tracing
 
-    resolved = config or load_telemetry_config()
-
     if resolved.enable_tracing:
         init_tracing(resolved)
     if resolved.enable_metrics:
@@ -5,31 +5,33 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from .config import EXPORT_MAX_BATCH_SIZE, EXPORT_MAX_QUEUE_SIZE, EXPORT_SCHEDULE_DELAY_MILLIS
+
 if TYPE_CHECKING:
     from .config import TelemetryConfig
 
-_LOGGER: logging.Logger | None = None
+_LOGGERS: dict[str, logging.Logger] = {}
 _HANDLER_INSTALLED = False
-_FILTER_INSTALLED = False
-
 
-class _OtelContextFilter(logging.Filter):
-    """Ensures trace/span placeholders exist even when no context is active."""
 
-    def filter(self, record: logging.LogRecord) -> bool:  # pragma: no cover - trivial
-        if not hasattr(record, "otelTraceID"):
-            record.otelTraceID = "-"
-        if not hasattr(record, "otelSpanID"):
-            record.otelSpanID = "-"
-        return True
+# Root console format; trace placeholders are filled in at format time when no span
+# context set the fields, and the formatter is shared by every handler we create.
+_ROOT_LOG_FORMAT = (
+    "%(asctime)s | %(levelname)s | %(name)s | %(message)s "
+    "| trace_id=%(otelTraceID)s span_id=%(otelSpanID)s"
+)
+_ROOT_FORMATTER = logging.Formatter(
+    _ROOT_LOG_FORMAT, defaults={"otelTraceID": "-", "otelSpanID": "-"}
+)
 
 
 def get_logger(name: str = "battleship") -> logging.Logger:
-    global _LOGGER
-    if _LOGGER is None:
-        _LOGGER = logging.getLogger(name)
-        _LOGGER.setLevel(logging.INFO)
-    return _LOGGER
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        logger = _LOGGERS.setdefault(name, logger)
+    return logger
 
 
 def init_logging(config: TelemetryConfig) -> logging.Logger:
@@ -53,7 +55,13 @@ def init_logging(config: TelemetryConfig) -> logging.Logger:
 
     if config.otlp_logs_endpoint:
         exporter = OTLPLogExporter(endpoint=config.otlp_logs_endpoint, insecure=True)
-        provider.add_log_record_processor(BatchLogRecordProcessor(exporter))
+        processor = BatchLogRecordProcessor(
+            exporter,
+            max_queue_size=EXPORT_MAX_QUEUE_SIZE,
+            max_export_batch_size=EXPORT_MAX_BATCH_SIZE,
+            schedule_delay_millis=EXPORT_SCHEDULE_DELAY_MILLIS,
+        )
+        provider.add_log_record_processor(processor)
 
     set_logger_provider(provider)
     handler = LoggingHandler(level=logging.INFO, logger_provider=provider)
@@ -64,25 +72,14 @@ def init_logging(config: TelemetryConfig) -> logging.Logger:
 
 def _install_root_handler(handler: logging.Handler) -> None:
     """Attach the OTLP logging handler to the root logger once."""
-    global _HANDLER_INSTALLED, _FILTER_INSTALLED
+    global _HANDLER_INSTALLED
     root_logger = logging.getLogger()
     if not root_logger.handlers:
-        logging.basicConfig(
-            level=logging.INFO,
-            format=(
-                "%(asctime)s | %(levelname)s | %(name)s | %(message)s "
-                "| trace_id=%(otelTraceID)s span_id=%(otelSpanID)s"
-            ),
-        )
-        # Attach placeholder filter to default handlers created above.
-        for existing in root_logger.handlers:
-            existing.addFilter(_OtelContextFilter())
-
-    if not _FILTER_INSTALLED:
-        root_logger.addFilter(_OtelContextFilter())
-        _FILTER_INSTALLED = True
+        console = logging.StreamHandler()
+        console.setFormatter(_ROOT_FORMATTER)
+        root_logger.addHandler(console)
+        root_logger.setLevel(logging.INFO)
 
     if not _HANDLER_INSTALLED:
-        handler.addFilter(_OtelContextFilter())
         root_logger.addHandler(handler)
         _HANDLER_INSTALLED = True
@@ -2,32 +2,40 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Mapping
 
 from opentelemetry import metrics as otel_metrics
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.metrics import Counter, Meter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
 
 if TYPE_CHECKING:  # pragma: no cover
+    from opentelemetry.sdk.metrics import MeterProvider as SdkMeterProvider
+
     from .config import TelemetryConfig
 
-_METER_PROVIDER: MeterProvider | None = None
+_METER_PROVIDER: SdkMeterProvider | None = None
 _METER: Meter | None = None
+_METERS: dict[str, Meter] = {}
 _INSTRUMENTS: dict[str, Counter] = {}
 
 
 def get_meter(name: str = "battleship") -> Meter:
-    global _METER
-    if _METER is None:
-        _METER = otel_metrics.get_meter(name)
-    return _METER
+    meter = _METERS.get(name)
+    if meter is None:
+        meter = _METERS.setdefault(name, otel_metrics.get_meter(name))
+    return meter
 
 
 def init_metrics(config: TelemetryConfig) -> Meter:
-    global _METER_PROVIDER, _METER, _INSTRUMENTS
+    global _METER_PROVIDER, _METER, _METERS, _INSTRUMENTS
+    # Only the first call registers a provider; later calls return the existing meter.
+    if _METER_PROVIDER is not None and _METER is not None:
+        return _METER
+    # The SDK and gRPC exporter load on first use so disabled metrics stay cheap to import.
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import MetricReader, PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
 
     attributes = {
         "service.name": config.service_name,
@@ -36,7 +44,7 @@ def init_metrics(config: TelemetryConfig) -> Meter:
     attributes.update(config.resource_attributes)
     resource = Resource.create(attributes)
 
-    readers = []
+    readers: list[MetricReader] = []
     if config.otlp_metrics_endpoint:
         exporter = OTLPMetricExporter(endpoint=config.otlp_metrics_endpoint, insecure=True)
         readers.append(PeriodicExportingMetricReader(exporter, export_interval_millis=5000))
@@ -46,17 +54,22 @@ def init_metrics(config: TelemetryConfig) -> Meter:
 
     _METER_PROVIDER = provider
     _METER = provider.get_meter(config.service_name)
+    _METERS = {config.service_name: _METER}
     _INSTRUMENTS = {}
     return _METER
 
 
 MetricAttributes = Mapping[str, str | bool | int | float]
 
+# Shared read-only attributes for calls that pass none.
+_EMPTY_ATTRS: MetricAttributes = MappingProxyType({})
+
 
 def record_game_metric(name: str, value: float, attrs: MetricAttributes | None = None) -> None:
-    meter = get_meter()
     instrument = _INSTRUMENTS.get(name)
     if instrument is None:
-        instrument = meter.create_counter(name)
-        _INSTRUMENTS[name] = instrument
-    instrument.add(value, attributes=attrs or {})
+        # Counters live on the configured service's meter once metrics are initialised.
+        meter = _METER if _METER is not None else get_meter()
+        # setdefault keeps the first counter registered if another thread raced us here.
+        instrument = _INSTRUMENTS.setdefault(name, meter.create_counter(name))
+    instrument.add(value, attributes=attrs or _EMPTY_ATTRS)
@@ -5,35 +5,41 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SimpleSpanProcessor,
-)
 from opentelemetry.trace import Tracer
 
+from .config import EXPORT_MAX_BATCH_SIZE, EXPORT_MAX_QUEUE_SIZE, EXPORT_SCHEDULE_DELAY_MILLIS
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from .config import TelemetryConfig
+    from opentelemetry.sdk.trace import TracerProvider as SdkTracerProvider
 
+    from .config import TelemetryConfig
 
 _TRACER: Tracer | None = None
-_TRACER_PROVIDER: TracerProvider | None = None
+_TRACER_PROVIDER: SdkTracerProvider | None = None
+_TRACERS: dict[str, Tracer] = {}
 
 
 def get_tracer(name: str = "battleship") -> Tracer:
-    """Return the global tracer (lazily initialised)."""
-    global _TRACER
-    if _TRACER is None:
-        _TRACER = trace.get_tracer(name)
-    return _TRACER
+    """Return the tracer for ``name`` (lazily initialised, cached per name)."""
+    tracer = _TRACERS.get(name)
+    if tracer is None:
+        tracer = _TRACERS.setdefault(name, trace.get_tracer(name))
+    return tracer
 
 
 def init_tracing(config: TelemetryConfig) -> Tracer:
-    """Initialise the TracerProvider according to the config."""
-    global _TRACER, _TRACER_PROVIDER
+    """Initialise the TracerProvider according to the config.
+
+    Only the first call registers a provider; later calls return the existing tracer.
+    """
+    global _TRACER, _TRACER_PROVIDER, _TRACERS
+    if _TRACER_PROVIDER is not None and _TRACER is not None:
+        return _TRACER
+    # The SDK and gRPC exporter load on first use so disabled tracing stays cheap to import.
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
     attributes = {
         "service.name": config.service_name,
@@ -43,13 +49,19 @@ def init_tracing(config: TelemetryConfig) -> Tracer:
     resource = Resource.create(attributes)
     provider = TracerProvider(resource=resource)
 
+    # Without an endpoint spans are recorded but not exported anywhere.
     if config.otlp_traces_endpoint:
         exporter = OTLPSpanExporter(endpoint=config.otlp_traces_endpoint, insecure=True)
-        provider.add_span_processor(BatchSpanProcessor(exporter))
-    else:
-        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+        processor = BatchSpanProcessor(
+            exporter,
+            max_queue_size=EXPORT_MAX_QUEUE_SIZE,
+            max_export_batch_size=EXPORT_MAX_BATCH_SIZE,
+            schedule_delay_millis=EXPORT_SCHEDULE_DELAY_MILLIS,
+        )
+        provider.add_span_processor(processor)
 
     trace.set_tracer_provider(provider)
     _TRACER_PROVIDER = provider
     _TRACER = provider.get_tracer(config.service_name)
+    _TRACERS = {config.service_name: _TRACER}
     return _TRACER
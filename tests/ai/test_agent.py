@@ -162,3 +162,40 @@ def test_train_step_updates_policy_weights() -> None:
     agent.train_step()
     after = list(agent.policy_net.parameters())
     assert any(not torch.allclose(b, a) for b, a in zip(before, after))
+
+
+def test_train_step_async_returns_device_loss() -> None:
+    config = AgentConfig(buffer_capacity=64, min_buffer_size=8, batch_size=8)
+    agent = DQNAgent(
+        obs_channels=C, num_actions=NUM_ACTIONS, config=config, device=torch.device("cpu")
+    )
+    assert agent.compute_stream is None
+    assert agent.train_step_async() is None
+
+    state = np.zeros((C, 10, 10), dtype=np.float32)
+    for action in range(config.min_buffer_size):
+        agent.store_transition(state, action, 1.0, state, False)
+
+    loss = agent.train_step_async()
+    assert isinstance(loss, torch.Tensor)
+    assert loss.ndim == 0
+    assert not loss.requires_grad
+    assert agent.train_steps == 1
+
+
+def test_select_action_batch_respects_masks() -> None:
+    config = AgentConfig(buffer_capacity=10, min_buffer_size=1, batch_size=1)
+    agent = DQNAgent(
+        obs_channels=C, num_actions=NUM_ACTIONS, config=config, device=torch.device("cpu")
+    )
+    states = np.zeros((3, C, 10, 10), dtype=np.float32)
+    masks = np.zeros((3, NUM_ACTIONS), dtype=np.int8)
+    masks[0, 5] = 1
+    masks[1, 42] = 1
+    masks[2, [7, 99]] = 1
+
+    actions = agent.select_action_batch(states, masks, training=False)
+    assert actions.shape == (3,)
+    assert actions[0] == 5
+    assert actions[1] == 42
+    assert actions[2] in (7, 99)
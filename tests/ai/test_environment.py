@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import numpy as np
 import pytest
 
@@ -15,10 +17,18 @@ from battleship.engine.game import GamePhase, Player
 from battleship.engine.ship import Coordinate, Orientation, ShipType
 
 
+@pytest.fixture(scope="module")
+def default_env() -> Iterator[BattleshipEnv]:
+    """Default-mode environment shared by the module; tests reseed it via ``reset``."""
+    env = BattleshipEnv()
+    yield env
+    env.close()
+
+
 def _first_legal_action(mask: np.ndarray) -> int:
-    legal = np.flatnonzero(mask)
-    assert legal.size > 0, "Expected at least one legal action"
-    return int(legal[0])
+    assert mask.any(), "Expected at least one legal action"
+    # argmax of a 0/1 mask is its first legal index, without materialising every index.
+    return int(mask.argmax())
 
 
 def test_env_initialization_default_mode() -> None:
@@ -29,9 +39,9 @@ def test_env_initialization_default_mode() -> None:
     env.close()
 
 
-def test_env_reset_default_mode() -> None:
-    env = BattleshipEnv(rng_seed=123)
-    observation, info = env.reset()
+def test_env_reset_default_mode(default_env: BattleshipEnv) -> None:
+    env = default_env
+    observation, info = env.reset(seed=123)
     assert observation.shape == env.observation_space.shape
     mask = info["action_mask"]
     assert isinstance(mask, np.ndarray)
@@ -39,12 +49,11 @@ def test_env_reset_default_mode() -> None:
     assert mask.sum() > 0
     assert info["phase"] == "firing"
     assert env.game is not None
-    env.close()
 
 
-def test_env_step_advances_game_default_mode() -> None:
-    env = BattleshipEnv(rng_seed=7)
-    _, info = env.reset()
+def test_env_step_advances_game_default_mode(default_env: BattleshipEnv) -> None:
+    env = default_env
+    _, info = env.reset(seed=7)
     action = _first_legal_action(info["action_mask"])
     observation, reward, terminated, truncated, info = env.step(action)
     assert observation.shape == env.observation_space.shape
@@ -52,12 +61,11 @@ def test_env_step_advances_game_default_mode() -> None:
     assert isinstance(terminated, bool)
     assert isinstance(truncated, bool)
     assert info["phase"] == "firing"
-    env.close()
 
 
-def test_invalid_action_penalty_default_mode() -> None:
-    env = BattleshipEnv(rng_seed=21)
-    _, info = env.reset()
+def test_invalid_action_penalty_default_mode(default_env: BattleshipEnv) -> None:
+    env = default_env
+    _, info = env.reset(seed=21)
     action = _first_legal_action(info["action_mask"])
     env.step(action)
     _, penalty, terminated, truncated, info = env.step(action)
@@ -65,7 +73,6 @@ def test_invalid_action_penalty_default_mode() -> None:
     assert not terminated
     assert not truncated
     assert info.get("invalid_action") is True
-    env.close()
 
 
 def test_deterministic_seeding() -> None:
@@ -93,9 +100,9 @@ def test_deterministic_seeding() -> None:
     env_b.close()
 
 
-def test_episode_completion() -> None:
-    env = BattleshipEnv(rng_seed=5)
-    _, info = env.reset()
+def test_episode_completion(default_env: BattleshipEnv) -> None:
+    env = default_env
+    _, info = env.reset(seed=5)
     final_info = info
     terminated = truncated = False
     for _ in range(1000):
@@ -107,7 +114,6 @@ def test_episode_completion() -> None:
     assert terminated or truncated
     if terminated:
         assert final_info["winner"] in {"PLAYER1", "PLAYER2"}
-    env.close()
 
 
 def test_agent_placement_extends_spaces() -> None:
@@ -209,25 +215,25 @@ def test_opponent_manual_placement_policy_invoked() -> None:
     env.close()
 
 
-def test_step_after_episode_completion_raises() -> None:
-    env = BattleshipEnv(rng_seed=13)
-    _, info = env.reset()
+def test_step_after_episode_completion_raises(default_env: BattleshipEnv) -> None:
+    env = default_env
+    _, info = env.reset(seed=13)
     terminated = truncated = False
     while not (terminated or truncated):
         action = _first_legal_action(info["action_mask"])
         _, _, terminated, truncated, info = env.step(action)
     with pytest.raises(RuntimeError):
         env.step(0)
-    env.close()
 
 
-def test_episode_truncates_when_max_steps_exceeded(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_episode_truncates_when_max_steps_exceeded(
+    monkeypatch: pytest.MonkeyPatch, default_env: BattleshipEnv
+) -> None:
     monkeypatch.setattr("battleship.ai.environment.MAX_STEPS", 1)
-    env = BattleshipEnv(rng_seed=15)
-    _, info = env.reset()
+    env = default_env
+    _, info = env.reset(seed=15)
     action = _first_legal_action(info["action_mask"])
     _, _, terminated, truncated, info = env.step(action)
     assert truncated or terminated
     if not terminated:
         assert truncated is True
-    env.close()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+from collections.abc import Iterator
 
 import numpy as np
 import pytest
@@ -44,14 +44,32 @@ def _small_config(tmp_path_factory: pytest.TempPathFactory) -> TrainingConfig:
     )
 
 
-def test_trainer_supports_external_opponent(tmp_path_factory: pytest.TempPathFactory) -> None:
-    config = _small_config(tmp_path_factory)
+@pytest.fixture(scope="module")
+def trainer(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Trainer]:
+    """Default-config trainer shared by tests that only need the random opponent."""
+    trainer = Trainer(_small_config(tmp_path_factory))
+    yield trainer
+    trainer.close()
+
+
+@pytest.fixture(scope="module")
+def opponent_trainer(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[tuple[Trainer, DeterministicOpponent]]:
+    """Default-config trainer wired to a shared external opponent."""
     opponent = DeterministicOpponent()
-    trainer = Trainer(config, opponent_agent=opponent)
+    trainer = Trainer(_small_config(tmp_path_factory), opponent_agent=opponent)
+    yield trainer, opponent
+    trainer.close()
+
+
+def test_trainer_supports_external_opponent(
+    opponent_trainer: tuple[Trainer, DeterministicOpponent],
+) -> None:
+    trainer, _ = opponent_trainer
     metrics = trainer._train_episode(0)
     assert "reward" in metrics
     assert trainer.episode_rewards
-    trainer.env.close()
 
 
 def test_trainer_self_play_enables_policy_wrapper(tmp_path_factory: pytest.TempPathFactory) -> None:
@@ -61,17 +79,17 @@ def test_trainer_self_play_enables_policy_wrapper(tmp_path_factory: pytest.TempP
     assert trainer.env.opponent_policy is not None
     metrics = trainer._train_episode(0)
     assert metrics["epsilon"] < trainer.config.epsilon_start
-    trainer.env.close()
+    trainer.close()
+    assert trainer.eval_envs is not None and trainer.eval_envs.closed
 
 
-def test_evaluation_restores_opponent_epsilon(tmp_path_factory: pytest.TempPathFactory) -> None:
-    config = _small_config(tmp_path_factory)
-    opponent = DeterministicOpponent()
-    trainer = Trainer(config, opponent_agent=opponent)
+def test_evaluation_restores_opponent_epsilon(
+    opponent_trainer: tuple[Trainer, DeterministicOpponent],
+) -> None:
+    trainer, opponent = opponent_trainer
     before = opponent.epsilon
     trainer._evaluate()
     assert opponent.epsilon == before
-    trainer.env.close()
 
 
 def test_trainer_handles_opponent_manual_placement(
@@ -82,38 +100,36 @@ def test_trainer_handles_opponent_manual_placement(
     opponent = DeterministicOpponent()
     trainer = Trainer(config, opponent_agent=opponent)
     trainer._train_episode(0)
-    trainer.env.close()
+    trainer.close()
 
 
-def test_policy_rollout_generates_summaries(tmp_path_factory: pytest.TempPathFactory) -> None:
-    config = _small_config(tmp_path_factory)
-    config.rollout_episodes = 2
-    trainer = Trainer(config)
-    output_file = Path(config.save_dir) / "rollouts.jsonl"
-    summaries = trainer._policy_rollout(output_path=output_file)
+def test_policy_rollout_generates_summaries(trainer: Trainer) -> None:
+    output_file = trainer.save_path / "rollouts.jsonl"
+    summaries = trainer._policy_rollout(episodes=2, output_path=output_file)
     assert len(summaries) == 2
     assert trainer.rollout_history
     assert output_file.exists()
     lines = output_file.read_text().strip().splitlines()
     assert len(lines) == 2
-    trainer.env.close()
 
 
-def test_metrics_persisted_with_episode_history(tmp_path_factory: pytest.TempPathFactory) -> None:
-    config = _small_config(tmp_path_factory)
-    config.num_episodes = 2
-    config.eval_interval = 1
-    trainer = Trainer(config)
-    for episode in range(1, config.num_episodes + 1):
+def test_metrics_persisted_with_episode_history(trainer: Trainer) -> None:
+    num_episodes = 2
+    for episode in range(1, num_episodes + 1):
         trainer._train_episode(episode)
         trainer._evaluate()
-        checkpoint = Path(config.save_dir) / f"checkpoint_ep{episode}.pt"
+        checkpoint = trainer.save_path / f"checkpoint_ep{episode}.pt"
         trainer.agent.save(checkpoint)
         assert checkpoint.exists()
     trainer._save_metrics()
 
-    metrics_path = Path(config.save_dir) / "metrics.json"
+    metrics_path = trainer.save_path / "metrics.json"
     payload = json.loads(metrics_path.read_text())
     assert payload["episode_rewards"]
     assert payload["eval_history"]
-    trainer.env.close()
+
+
+@pytest.mark.parametrize("log_interval", [0, -1])
+def test_training_config_rejects_non_positive_log_interval(log_interval: int) -> None:
+    with pytest.raises(ValueError, match="log_interval"):
+        TrainingConfig(log_interval=log_interval)
@@ -0,0 +1,35 @@
+"""Tests for the batched game engine."""
+
+import numpy as np
+import pytest
+from battleship.engine.batch import GameBatch
+from battleship.engine.board import CELL_UNKNOWN
+from battleship.engine.game import Player
+
+
+def test_game_batch_plays_random_games_to_completion() -> None:
+    batch = GameBatch(8, rng_seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(200):
+        if batch.done():
+            break
+        mask = batch.legal_moves_mask()
+        moves = [rng.choice(np.flatnonzero(row)) if row.any() else 0 for row in mask]
+        batch.step(moves)
+    assert batch.done()
+    assert all(batch.winner(game) in (Player.PLAYER1, Player.PLAYER2) for game in range(8))
+
+
+def test_game_batch_repeated_cell_keeps_the_turn() -> None:
+    batch = GameBatch(2, rng_seed=0)
+    assert CELL_UNKNOWN not in batch.step([5, 5]).tolist()
+    batch.step([5, 5])
+    outcomes = batch.step([5, 5]).tolist()
+    assert outcomes == [CELL_UNKNOWN, CELL_UNKNOWN]
+    assert batch.current_players.tolist() == [0, 0]
+
+
+def test_game_batch_rejects_out_of_bounds_moves() -> None:
+    batch = GameBatch(1)
+    with pytest.raises(ValueError):
+        batch.step([100])
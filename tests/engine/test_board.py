@@ -3,6 +3,8 @@
 import random
 
 import pytest
+from battleship.engine import _engine_numba as engine_numba
+from battleship.engine import board as board_module
 from battleship.engine.board import Board, CellState
 from battleship.engine.ship import Coordinate, Orientation, Ship, ShipType
 
@@ -31,6 +33,30 @@ def test_board_shot_tracking() -> None:
     assert board.all_ships_sunk()
 
 
+def test_shots_view_is_read_only() -> None:
+    board = Board()
+    board.receive_shot(Coordinate(0, 0))
+
+    with pytest.raises(TypeError):
+        board.shots[Coordinate(1, 1)] = CellState.MISS
+    assert board.shots == {Coordinate(0, 0): CellState.MISS}
+
+
+def test_reset_clears_ships_and_shots() -> None:
+    board = Board()
+    ship = Ship(ShipType.DESTROYER, Coordinate(0, 0), Orientation.HORIZONTAL)
+    board.place_ship(ship)
+    board.receive_shot(Coordinate(0, 0))
+
+    board.reset()
+    assert board.ships == []
+    assert board.shots == {}
+    assert board.snapshot().ships == ()
+    board.place_ship(Ship(ShipType.DESTROYER, Coordinate(0, 0), Orientation.HORIZONTAL))
+    hit_state, _ = board.receive_shot(Coordinate(0, 0))
+    assert hit_state is CellState.HIT
+
+
 def test_ship_placement_rejects_overlap_and_bounds() -> None:
     board = Board()
     horizontal = Ship(ShipType.CRUISER, Coordinate(0, 0), Orientation.HORIZONTAL)
@@ -67,3 +93,28 @@ def test_get_cell_state_defaults_to_unknown() -> None:
     board = Board()
     state = board.get_cell_state(Coordinate(4, 4))
     assert state is CellState.UNKNOWN
+
+
+def test_random_placement_respects_adjacency_rule() -> None:
+    board = Board(allow_adjacent=False)
+    board.random_placement(rng=random.Random(7))
+    replay = Board(allow_adjacent=False)
+    for ship in board.ships:
+        replay.place_ship(Ship(ship.ship_type, ship.start, ship.orientation))
+    assert len(replay.ships) == len(ShipType)
+
+
+@pytest.mark.parametrize("allow_adjacent", [True, False])
+def test_random_placement_matches_uncompiled_kernel(
+    monkeypatch: pytest.MonkeyPatch, allow_adjacent: bool
+) -> None:
+    compiled = Board(allow_adjacent=allow_adjacent)
+    compiled.random_placement(rng=random.Random(7))
+
+    # Without numba the kernels run as plain Python; the same seed must deal the same fleet.
+    for module, name in ((engine_numba, "_next_random"), (board_module, "_random_placement_nb")):
+        kernel = getattr(module, name)
+        monkeypatch.setattr(module, name, getattr(kernel, "py_func", kernel))
+    plain = Board(allow_adjacent=allow_adjacent)
+    plain.random_placement(rng=random.Random(7))
+    assert plain.snapshot().ships == compiled.snapshot().ships
@@ -1,29 +1,44 @@
 """High-level gameplay tests."""
 
+import copy
 import random
 
+import numpy as np
 import pytest
 
+from battleship.engine.board import Board
 from battleship.engine.game import BattleshipGame, GamePhase, Player
 from battleship.engine.ship import Coordinate, Orientation, Ship, ShipType
 
 
-def test_game_flow() -> None:
-    rng_seed = 42
-    game = BattleshipGame(rng_seed=rng_seed)
+@pytest.fixture(scope="module")
+def started_game_template() -> BattleshipGame:
+    game = BattleshipGame(rng_seed=42)
     game.setup_random()
+    return game
 
+
+@pytest.fixture
+def started_game(started_game_template: BattleshipGame) -> BattleshipGame:
+    """Independent copy of a game whose fleets were dealt once for the module."""
+    return copy.deepcopy(started_game_template)
+
+
+def test_game_flow(started_game: BattleshipGame) -> None:
+    game = started_game
+
+    rng = np.random.default_rng(42)
     seen_moves = set()
     while game.get_state().phase is not GamePhase.FINISHED:
         state = game.get_state()
         player = state.current_player
-        valid_moves = game.valid_moves(player)
-        assert valid_moves, "There should always be a valid move while game in progress."
-        coord = random.choice(valid_moves)
-        move_key = (player, coord)
+        valid_moves = game.valid_moves_array(player)
+        assert valid_moves.size, "There should always be a valid move while game in progress."
+        cell = int(valid_moves[rng.integers(valid_moves.size)])
+        move_key = (player, cell)
         assert move_key not in seen_moves, "Duplicate move attempted."
         seen_moves.add(move_key)
-        game.make_move(player, coord)
+        game.make_move(player, cell)
 
     final_state = game.get_state()
     assert final_state.winner is not None
@@ -37,9 +52,8 @@ def test_make_move_requires_in_progress_game() -> None:
         game.make_move(Player.PLAYER1, Coordinate(0, 0))
 
 
-def test_make_move_enforces_turn_order() -> None:
-    game = BattleshipGame(rng_seed=1)
-    game.setup_random()
+def test_make_move_enforces_turn_order(started_game: BattleshipGame) -> None:
+    game = started_game
     first_coord = game.valid_moves(Player.PLAYER1)[0]
     game.make_move(Player.PLAYER1, first_coord)
 
@@ -47,6 +61,17 @@ def test_make_move_enforces_turn_order() -> None:
         game.make_move(Player.PLAYER1, game.valid_moves(Player.PLAYER1)[0])
 
 
+def test_phase_and_current_player_can_be_set_independently() -> None:
+    game = BattleshipGame()
+    game.current_player = Player.PLAYER2
+    game.phase = GamePhase.IN_PROGRESS
+    assert game.phase is GamePhase.IN_PROGRESS
+    assert game.current_player is Player.PLAYER2
+
+    with pytest.raises(RuntimeError, match="turn"):
+        game.make_move(Player.PLAYER1, Coordinate(0, 0))
+
+
 def test_valid_moves_empty_before_game_starts() -> None:
     game = BattleshipGame()
     assert game.valid_moves(Player.PLAYER1) == []
@@ -57,8 +82,7 @@ def test_game_detects_winner_once_all_ships_sunk() -> None:
     attacker = Player.PLAYER1
     defender = attacker.opponent()
     defender_board = game.boards[defender]
-    defender_board.ships.clear()
-    defender_board.shots.clear()
+    defender_board.reset()
     ship = Ship(ShipType.DESTROYER, Coordinate(0, 0), Orientation.HORIZONTAL)
     defender_board.place_ship(ship)
     game.phase = GamePhase.IN_PROGRESS
@@ -71,9 +95,8 @@ def test_game_detects_winner_once_all_ships_sunk() -> None:
     assert game.winner is attacker
 
 
-def test_game_state_snapshot_reflects_shots_and_phase() -> None:
-    game = BattleshipGame(rng_seed=5)
-    game.setup_random()
+def test_game_state_snapshot_reflects_shots_and_phase(started_game: BattleshipGame) -> None:
+    game = started_game
     player = Player.PLAYER1
     target = game.valid_moves(player)[0]
     game.make_move(player, target)
@@ -81,3 +104,87 @@ def test_game_state_snapshot_reflects_shots_and_phase() -> None:
     assert state.phase in {GamePhase.IN_PROGRESS, GamePhase.FINISHED}
     opponent_board = state.boards[player.opponent()]
     assert target in opponent_board.shots
+
+
+def test_game_state_reuses_board_snapshots_until_boards_change() -> None:
+    game = BattleshipGame(rng_seed=5)
+    game.setup_random()
+    first = game.get_state()
+    assert game.get_state().boards[Player.PLAYER2] is first.boards[Player.PLAYER2]
+
+    game.make_move(Player.PLAYER1, game.valid_moves(Player.PLAYER1)[0])
+    second = game.get_state()
+    assert second.boards[Player.PLAYER2] is not first.boards[Player.PLAYER2]
+    assert second.boards[Player.PLAYER1] is first.boards[Player.PLAYER1]
+
+
+def test_make_move_accepts_packed_cell_index() -> None:
+    game = BattleshipGame(rng_seed=9)
+    game.setup_random()
+    game.make_move(Player.PLAYER1, 3 * 10 + 7)
+    assert Coordinate(3, 7) not in game.valid_moves(Player.PLAYER1)
+    with pytest.raises(ValueError):
+        game.make_move(Player.PLAYER2, 100)
+
+
+def test_make_move_targets_replaced_board() -> None:
+    game = BattleshipGame(rng_seed=9)
+    game.setup_random()
+    replacement = Board(owner=Player.PLAYER2.value)
+    replacement.random_placement(random.Random(3))
+    game.boards[Player.PLAYER2] = replacement
+
+    game.make_move(Player.PLAYER1, Coordinate(0, 0))
+    assert Coordinate(0, 0) in replacement.shots
+    assert Coordinate(0, 0) not in game.valid_moves(Player.PLAYER1)
+
+
+def test_play_random_game_runs_policies_to_a_winner() -> None:
+    def first_unknown(shot_grid: np.ndarray) -> int:
+        return int(np.flatnonzero(shot_grid.ravel() == 0)[0])
+
+    game = BattleshipGame(rng_seed=11)
+    winner = game.play_random_game(first_unknown, first_unknown)
+    assert game.phase is GamePhase.FINISHED
+    assert game.winner is winner
+    assert game.boards[winner.opponent()].all_ships_sunk()
+
+
+def test_play_random_game_accepts_numpy_int_policies() -> None:
+    rng = np.random.default_rng(3)
+
+    def random_unknown(shot_grid: np.ndarray) -> np.int64:
+        return rng.choice(np.flatnonzero(shot_grid.ravel() == 0))
+
+    game = BattleshipGame(rng_seed=11)
+    winner = game.play_random_game(random_unknown, random_unknown)
+    assert game.boards[winner.opponent()].all_ships_sunk()
+    assert np.count_nonzero(game.boards[winner.opponent()].shot_grid) < 100
+
+
+@pytest.mark.parametrize("bad_cell", [-1, 100, 105])
+def test_play_random_game_rejects_off_board_policy(bad_cell: int) -> None:
+    game = BattleshipGame(rng_seed=11)
+    with pytest.raises(ValueError, match="out of bounds"):
+        game.play_random_game(lambda _: bad_cell, lambda _: bad_cell)
+    assert not game.boards[Player.PLAYER2].shot_grid.any()
+
+
+def test_valid_moves_array_matches_valid_moves() -> None:
+    game = BattleshipGame(rng_seed=2)
+    assert game.valid_moves_array(Player.PLAYER1).size == 0
+    game.setup_random()
+    game.make_move(Player.PLAYER1, Coordinate(0, 4))
+    cells = game.valid_moves_array(Player.PLAYER1)
+    assert cells.dtype == np.int32
+    assert cells.tolist() == [c.row * 10 + c.col for c in game.valid_moves(Player.PLAYER1)]
+    assert 4 not in cells
+
+
+def test_started_game_copies_are_independent(
+    started_game_template: BattleshipGame, started_game: BattleshipGame
+) -> None:
+    started_game.make_move(Player.PLAYER1, 0)
+    assert started_game.current_player is Player.PLAYER2
+    assert started_game_template.current_player is Player.PLAYER1
+    assert started_game_template.boards[Player.PLAYER2].shot_grid[0, 0] == 0
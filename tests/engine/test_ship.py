@@ -1,11 +1,11 @@
 """Tests for Ship domain logic."""
 
-from battleship.engine.ship import Coordinate, Orientation, Ship, ShipType
+from battleship.engine.ship import SHIP_MASK_TABLE, Coordinate, Orientation, Ship, ShipType
 
 
 def test_ship_coordinates_horizontal() -> None:
     ship = Ship(ShipType.DESTROYER, Coordinate(0, 0), Orientation.HORIZONTAL)
-    assert ship.coordinates() == [Coordinate(0, 0), Coordinate(0, 1)]
+    assert ship.coordinates() == (Coordinate(0, 0), Coordinate(0, 1))
 
 
 def test_ship_hit_and_sink() -> None:
@@ -13,3 +13,49 @@ def test_ship_hit_and_sink() -> None:
     for idx, coord in enumerate(ship.coordinates(), start=1):
         assert ship.hit(coord) is True
         assert ship.is_sunk() is (idx == ship.ship_type.length)
+
+
+def test_ship_mask_table_matches_coordinates() -> None:
+    ship = Ship(ShipType.BATTLESHIP, Coordinate(2, 6), Orientation.HORIZONTAL)
+    mask, coords, cells = SHIP_MASK_TABLE[ship.layout_key()]
+    assert coords == ship.coordinates()
+    assert cells == ship.cells() == (26, 27, 28, 29)
+    assert mask == sum(1 << (coord.row * 10 + coord.col) for coord in coords)
+    assert SHIP_MASK_TABLE[(ShipType.BATTLESHIP, Orientation.HORIZONTAL, 2, 7)] is None
+
+
+def test_ship_tracks_cells_and_hits_as_bitmasks() -> None:
+    ship = Ship(ShipType.DESTROYER, Coordinate(4, 8), Orientation.HORIZONTAL)
+    other = Ship(ShipType.CRUISER, Coordinate(2, 9), Orientation.VERTICAL)
+    assert ship.mask == (1 << 48) | (1 << 49)
+    assert ship.overlaps(other)
+
+    assert ship.hit(48) is True
+    assert ship.hit(Coordinate(4, 8)) is False
+    assert ship.hit(Coordinate(4, 10)) is False
+    assert ship.hits == {Coordinate(4, 8)}
+    assert ship.hit(Coordinate(4, 9)) is True
+    assert ship.hits_mask == ship.mask
+    assert ship.is_sunk()
+
+
+def test_coordinate_is_a_named_tuple() -> None:
+    coord = Coordinate(3, 7)
+    assert coord == (3, 7)
+    assert hash(coord) == hash((3, 7))
+    assert (coord.row, coord.col) == (3, 7)
+
+
+def test_coordinate_and_ship_use_slots() -> None:
+    ship = Ship(ShipType.DESTROYER, Coordinate(0, 0), Orientation.HORIZONTAL)
+    assert not hasattr(ship.start, "__dict__")
+    assert not hasattr(ship, "__dict__")
+
+
+def test_off_board_ship_reports_only_on_board_hits() -> None:
+    ship = Ship(ShipType.CRUISER, Coordinate(0, -1), Orientation.HORIZONTAL)
+    assert ship.cells() == (-1, 0, 1)
+    assert ship.hits == set()
+
+    assert ship.hit(Coordinate(0, 0)) is True
+    assert ship.hits == {Coordinate(0, 0)}
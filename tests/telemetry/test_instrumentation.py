@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import os
+import subprocess
+import sys
+from collections import Counter
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+import torch
+from battleship.ai import environment as environment_module
+from battleship.ai import instrumented_agent as instrumented_agent_module
 from battleship.ai.agent import AgentConfig, DQNAgent
 from battleship.ai.environment import BattleshipEnv
 from battleship.ai.instrumented_agent import InstrumentedDQNAgent
 from battleship.telemetry import config as telemetry_config_module
 from battleship.engine.board import CellState
+from battleship.engine import instrumented_game as instrumented_game_module
 from battleship.engine.game import BattleshipGame, GamePhase, Player
 from battleship.engine.instrumented_game import InstrumentedBattleshipGame
 from battleship.engine.ship import Coordinate
@@ -19,11 +28,21 @@ from battleship.telemetry import metrics as metrics_module
 from battleship.telemetry import tracer as tracer_module
 from battleship.telemetry.config import TelemetryConfig
 
+# Shared zero observation and legal-action set; select_action only reads them.
+_ZERO_OBS = np.zeros((6, 10, 10), dtype=np.float32)
+_LEGAL_01 = (0, 1)
+
+
+def patch_module(monkeypatch: pytest.MonkeyPatch, module: object, **attrs: object) -> None:
+    """Monkeypatch several attributes of an already-imported module."""
+    for name, value in attrs.items():
+        monkeypatch.setattr(module, name, value)
+
 
 class DummySpan:
-    def __init__(self, names: list[str], span_name: str) -> None:
+    def __init__(self, names: set[str], span_name: str) -> None:
         self._names = names
-        self._names.append(span_name)
+        self._names.add(span_name)
 
     def __enter__(self):
         return self
@@ -37,56 +56,198 @@ class DummySpan:
 
 class DummyTracer:
     def __init__(self) -> None:
-        self.span_names: list[str] = []
+        self.span_names: set[str] = set()
 
     def start_as_current_span(self, name: str):
         return DummySpan(self.span_names, name)
 
 
+def _stub_dqn_init(
+    self: DQNAgent,
+    obs_channels: int,
+    num_actions: int = 100,
+    config: AgentConfig | None = None,
+    device: torch.device | None = None,
+) -> None:
+    """Set only what the instrumented wrappers touch, skipping network and buffer builds."""
+    self.config = config or AgentConfig()
+    self.num_actions = num_actions
+    self.device = torch.device("cpu")
+    self.policy_net = lambda state: {"q_values": torch.zeros((state.shape[0], num_actions))}
+    self.replay_buffer = []
+    self.epsilon = self.config.epsilon_start
+    self.train_steps = 0
+    self._state_staging = None
+    self._update_event = None
+
+
+class TelemetrySpy:
+    """Stands in for a module's tracer, logger and metric recorder."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, logger: MagicMock) -> None:
+        self._monkeypatch = monkeypatch
+        self.tracer = DummyTracer()
+        self.logger = logger
+        self.metric_counts: Counter[str] = Counter()
+
+    def attach(
+        self, module: object, tracer_attr: str = "get_tracer", logger_attr: str = "get_logger"
+    ) -> None:
+        patch_module(
+            self._monkeypatch,
+            module,
+            **{tracer_attr: lambda *_: self.tracer, logger_attr: lambda *_: self.logger},
+            record_game_metric=self._record,
+        )
+
+    def _record(self, name: str, value: float, attrs: dict | None = None) -> None:
+        self.metric_counts[name] += 1
+
+
+@pytest.fixture(scope="session")
+def shared_logger() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def telemetry_spy(monkeypatch: pytest.MonkeyPatch, shared_logger: MagicMock) -> TelemetrySpy:
+    shared_logger.reset_mock()
+    return TelemetrySpy(monkeypatch, shared_logger)
+
+
+@pytest.fixture(scope="module")
+def env_template() -> BattleshipEnv:
+    env = BattleshipEnv(rng_seed=3)
+    env.reset()
+    return env
+
+
+@pytest.fixture
+def telemetry_env(env_template: BattleshipEnv) -> BattleshipEnv:
+    """Independent copy of an environment built and warmed up once for the module."""
+    return copy.deepcopy(env_template)
+
+
+_SINGLETON_RESETS = (
+    (tracer_module, "_TRACER", None),
+    (tracer_module, "_TRACER_PROVIDER", None),
+    (metrics_module, "_METER", None),
+    (metrics_module, "_METER_PROVIDER", None),
+)
+_SINGLETON_CACHES = (
+    (tracer_module, "_TRACERS"),
+    (metrics_module, "_METERS"),
+    (metrics_module, "_INSTRUMENTS"),
+    (logger_module, "_LOGGERS"),
+)
+
+
+@pytest.fixture(autouse=True)
 def reset_singletons() -> None:
-    tracer_module._TRACER = None
-    tracer_module._TRACER_PROVIDER = None
-    metrics_module._METER = None
-    metrics_module._METER_PROVIDER = None
-    metrics_module._INSTRUMENTS = {}
-    logger_module._LOGGER = None
+    for module, attr, value in _SINGLETON_RESETS:
+        setattr(module, attr, value)
+    for module, attr in _SINGLETON_CACHES:
+        getattr(module, attr).clear()
+
+
+@pytest.mark.parametrize(
+    ("module", "getter", "init", "provider_path", "exporter_path", "singleton_attr", "cfg_kwargs"),
+    [
+        pytest.param(
+            tracer_module,
+            "get_tracer",
+            "init_tracing",
+            "opentelemetry.sdk.trace.TracerProvider",
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter.OTLPSpanExporter",
+            "_TRACER",
+            {"enable_tracing": True, "otlp_traces_endpoint": "http://example"},
+            id="tracer",
+        ),
+        pytest.param(
+            metrics_module,
+            "get_meter",
+            "init_metrics",
+            "opentelemetry.sdk.metrics.MeterProvider",
+            "opentelemetry.exporter.otlp.proto.grpc.metric_exporter.OTLPMetricExporter",
+            "_METER",
+            {"enable_metrics": True, "otlp_metrics_endpoint": "http://example"},
+            id="meter",
+        ),
+    ],
+)
+def test_lazy_init(
+    monkeypatch: pytest.MonkeyPatch,
+    module: object,
+    getter: str,
+    init: str,
+    provider_path: str,
+    exporter_path: str,
+    singleton_attr: str,
+    cfg_kwargs: dict[str, object],
+) -> None:
+    get = getattr(module, getter)
+    assert get() is get()
+
+    provider_instance = MagicMock()
+    provider_cls = MagicMock(return_value=provider_instance)
+    # init_* imports the SDK at call time, so patch the classes where they are defined.
+    monkeypatch.setattr(provider_path, provider_cls)
+    monkeypatch.setattr(exporter_path, MagicMock())
+    first = getattr(module, init)(TelemetryConfig(**cfg_kwargs))
+    assert getattr(module, singleton_attr) is getattr(provider_instance, getter).return_value
 
+    # A second init keeps the registered provider instead of building another.
+    assert getattr(module, init)(TelemetryConfig(**cfg_kwargs)) is first
+    provider_cls.assert_called_once()
 
-def test_lazy_init_tracer(monkeypatch: pytest.MonkeyPatch) -> None:
-    reset_singletons()
-    assert tracer_module.get_tracer() is tracer_module.get_tracer()
 
+def test_record_game_metric_uses_configured_meter(monkeypatch: pytest.MonkeyPatch) -> None:
     provider_instance = MagicMock()
-    provider_instance.get_tracer.return_value = MagicMock()
-    monkeypatch.setattr(tracer_module, "TracerProvider", MagicMock(return_value=provider_instance))
-    monkeypatch.setattr(tracer_module, "OTLPSpanExporter", MagicMock(return_value=MagicMock()))
-    tracer_module.init_tracing(
-        TelemetryConfig(enable_tracing=True, otlp_traces_endpoint="http://example")
-    )
-    assert tracer_module._TRACER is provider_instance.get_tracer.return_value
-
-    meter_provider = MagicMock()
-    meter_provider.get_meter.return_value = MagicMock()
-    monkeypatch.setattr(metrics_module, "MeterProvider", MagicMock(return_value=meter_provider))
-    monkeypatch.setattr(metrics_module, "OTLPMetricExporter", MagicMock(return_value=MagicMock()))
-    metrics_module.init_metrics(
-        TelemetryConfig(enable_metrics=True, otlp_metrics_endpoint="http://example")
+    monkeypatch.setattr(
+        "opentelemetry.sdk.metrics.MeterProvider", MagicMock(return_value=provider_instance)
     )
-    assert metrics_module._METER is meter_provider.get_meter.return_value
+    meter = metrics_module.init_metrics(TelemetryConfig(enable_metrics=True, service_name="svc"))
+    provider_instance.get_meter.assert_called_once_with("svc")
+
+    metrics_module.record_game_metric("battleship_test_total", 1)
+    meter.create_counter.assert_called_once_with("battleship_test_total")
 
 
 def test_logging_init_noop() -> None:
-    reset_singletons()
     logger = logger_module.get_logger("test")
-    assert logger_module.init_logging(TelemetryConfig()) is logger
+    assert logger_module.init_logging(TelemetryConfig(service_name="test")) is logger
+
+
+def test_telemetry_helpers_cache_per_name() -> None:
+    assert logger_module.get_logger("a") is logger_module.get_logger("a")
+    assert logger_module.get_logger("a").name == "a"
+    assert logger_module.get_logger("b").name == "b"
+    assert tracer_module.get_tracer("a") is tracer_module.get_tracer("a")
+    tracer_module.get_tracer("b")
+    assert set(tracer_module._TRACERS) == {"a", "b"}
+    assert metrics_module.get_meter("a") is metrics_module.get_meter("a")
+    metrics_module.get_meter("b")
+    assert set(metrics_module._METERS) == {"a", "b"}
+
+
+def test_telemetry_package_import_is_lazy() -> None:
+    code = (
+        "import sys, battleship.telemetry as t, battleship.telemetry.config as c\n"
+        "c.init_telemetry(c.TelemetryConfig())\n"
+        "assert not any(m.startswith('opentelemetry') for m in sys.modules)\n"
+        "assert 'battleship.telemetry.tracer' not in sys.modules\n"
+        "assert t.get_meter is t.metrics.get_meter\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
 
 
 def test_init_telemetry_noop(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[str] = []
 
-    monkeypatch.setattr(telemetry_config_module, "init_tracing", lambda cfg: calls.append("tr"))
-    monkeypatch.setattr(telemetry_config_module, "init_metrics", lambda cfg: calls.append("me"))
-    monkeypatch.setattr(telemetry_config_module, "init_logging", lambda cfg: calls.append("lo"))
+    monkeypatch.setattr(tracer_module, "init_tracing", lambda cfg: calls.append("tr"))
+    monkeypatch.setattr(metrics_module, "init_metrics", lambda cfg: calls.append("me"))
+    monkeypatch.setattr(logger_module, "init_logging", lambda cfg: calls.append("lo"))
 
     telemetry_config_module.init_telemetry(TelemetryConfig())
     assert calls == []
@@ -95,15 +256,24 @@ def test_init_telemetry_noop(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_init_telemetry_respects_flags(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[str] = []
 
-    monkeypatch.setattr(telemetry_config_module, "init_tracing", lambda cfg: calls.append("tr"))
-    monkeypatch.setattr(telemetry_config_module, "init_metrics", lambda cfg: calls.append("me"))
-    monkeypatch.setattr(telemetry_config_module, "init_logging", lambda cfg: calls.append("lo"))
+    monkeypatch.setattr(tracer_module, "init_tracing", lambda cfg: calls.append("tr"))
+    monkeypatch.setattr(metrics_module, "init_metrics", lambda cfg: calls.append("me"))
+    monkeypatch.setattr(logger_module, "init_logging", lambda cfg: calls.append("lo"))
 
     config = TelemetryConfig(enable_tracing=True, enable_logging=True)
     telemetry_config_module.init_telemetry(config)
     assert calls == ["tr", "lo"]
 
 
+def test_config_from_env_uses_defaults_and_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OTEL_RESOURCE_ATTRIBUTES", "team=rl")
+    config = TelemetryConfig.from_env(service_name="trainer")
+    assert config.service_name == "trainer"
+    assert config.service_namespace == "game"
+    assert config.resource_attributes == {"team": "rl"}
+    assert TelemetryConfig().resource_attributes == {}
+
+
 def test_load_telemetry_config_cached(monkeypatch: pytest.MonkeyPatch) -> None:
     telemetry_config_module.load_telemetry_config.cache_clear()
 
@@ -124,21 +294,16 @@ def test_load_telemetry_config_cached(monkeypatch: pytest.MonkeyPatch) -> None:
     second = telemetry_config_module.load_telemetry_config()
     assert first is second
     assert calls["count"] == 1
+    assert telemetry_config_module.load_telemetry_config.cache_info().hits == 1
 
     telemetry_config_module.TelemetryConfig.from_env = original_from_env  # type: ignore[assignment]
 
 
-def test_instrumented_game_emits_spans(monkeypatch: pytest.MonkeyPatch) -> None:
-    tracer = DummyTracer()
-    metrics_calls: list[tuple[str, float, dict | None]] = []
-    logger = MagicMock()
-
-    monkeypatch.setattr("battleship.engine.instrumented_game.get_tracer", lambda *_: tracer)
-    monkeypatch.setattr("battleship.engine.instrumented_game.get_logger", lambda *_: logger)
-    monkeypatch.setattr(
-        "battleship.engine.instrumented_game.record_game_metric",
-        lambda name, value, attrs=None: metrics_calls.append((name, value, attrs)),
-    )
+def test_instrumented_game_emits_spans(
+    monkeypatch: pytest.MonkeyPatch, telemetry_spy: TelemetrySpy
+) -> None:
+    telemetry_spy.attach(instrumented_game_module)
+    tracer = telemetry_spy.tracer
     monkeypatch.setattr(BattleshipGame, "setup_random", lambda self: None)
 
     def fake_make_move(self, player, coord):
@@ -154,66 +319,75 @@ def test_instrumented_game_emits_spans(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "battleship.engine.setup_random" in tracer.span_names
 
     tracer.span_names.clear()
-    metrics_calls.clear()
+    telemetry_spy.metric_counts.clear()
     game.make_move(Player.PLAYER1, Coordinate(0, 0))
     assert "battleship.engine.make_move" in tracer.span_names
     assert "battleship.engine.game_complete" in tracer.span_names
-    metric_names = {name for name, _, _ in metrics_calls}
-    assert "battleship_shots_total" in metric_names
-    assert "battleship_game_completed_total" in metric_names
+    assert "battleship_shots_total" in telemetry_spy.metric_counts
+    assert "battleship_game_completed_total" in telemetry_spy.metric_counts
 
 
-def test_instrumented_agent_records_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
-    tracer = DummyTracer()
-    logger = MagicMock()
-    metric_calls: list[str] = []
+def test_instrumented_play_random_game_closes_game_span(telemetry_spy: TelemetrySpy) -> None:
+    telemetry_spy.attach(instrumented_game_module)
+
+    def first_unknown(shot_grid: np.ndarray) -> int:
+        return int(np.flatnonzero(shot_grid.ravel() == 0)[0])
+
+    game = InstrumentedBattleshipGame(rng_seed=0)
+    game.play_random_game(first_unknown, first_unknown)
+    assert "battleship.engine.game_complete" in telemetry_spy.tracer.span_names
+    assert "battleship_game_completed_total" in telemetry_spy.metric_counts
+    assert game._game_span_cm is None
 
-    monkeypatch.setattr("battleship.ai.instrumented_agent.get_tracer", lambda *_: tracer)
-    monkeypatch.setattr("battleship.ai.instrumented_agent.get_logger", lambda *_: logger)
-    monkeypatch.setattr(
-        "battleship.ai.instrumented_agent.record_game_metric",
-        lambda name, value, attrs=None: metric_calls.append(name),
-    )
+
+def test_instrumented_agent_records_metrics(
+    monkeypatch: pytest.MonkeyPatch, telemetry_spy: TelemetrySpy
+) -> None:
+    telemetry_spy.attach(instrumented_agent_module)
+    tracer = telemetry_spy.tracer
+    monkeypatch.setattr(DQNAgent, "__init__", _stub_dqn_init)
 
     config = AgentConfig(buffer_capacity=10, min_buffer_size=1, batch_size=1)
     agent = InstrumentedDQNAgent(obs_channels=6, num_actions=4, config=config)
-    obs = np.zeros((6, 10, 10), dtype=np.float32)
 
-    action = agent.select_action(obs, legal_actions=[0, 1], training=False)
-    assert action in (0, 1)
+    action = agent.select_action(_ZERO_OBS, legal_actions=_LEGAL_01, training=False)
+    assert action in _LEGAL_01
     assert "battleship.agent.select_action" in tracer.span_names
-    assert "battleship_agent_actions_total" in metric_calls
-    assert "battleship_agent_action_latency_ms" in metric_calls
+    assert "battleship_agent_actions_total" in telemetry_spy.metric_counts
+    assert "battleship_agent_action_latency_ms" in telemetry_spy.metric_counts
 
-    metric_calls.clear()
+    telemetry_spy.metric_counts.clear()
     monkeypatch.setattr(DQNAgent, "train_step", lambda self: 0.25)
     agent.train_step()
     assert "battleship.agent.train_step" in tracer.span_names
-    assert "battleship_agent_training_steps_total" in metric_calls
-    assert "battleship_agent_training_loss" in metric_calls
+    assert "battleship_agent_training_steps_total" in telemetry_spy.metric_counts
+    assert "battleship_agent_training_loss" in telemetry_spy.metric_counts
 
+    # With too few transitions buffered no update is scheduled, so no step is counted.
+    telemetry_spy.metric_counts.clear()
+    assert agent.train_step_async() is None
+    assert "battleship_agent_training_steps_total" not in telemetry_spy.metric_counts
 
-def test_environment_records_telemetry(monkeypatch: pytest.MonkeyPatch) -> None:
-    tracer = DummyTracer()
-    metrics: list[str] = []
-    env_logger = MagicMock()
 
-    monkeypatch.setattr("battleship.ai.environment.get_otel_tracer", lambda *_: tracer)
-    monkeypatch.setattr("battleship.ai.environment.get_otel_logger", lambda *_: env_logger)
-    monkeypatch.setattr("battleship.ai.environment.logger", env_logger)
-    monkeypatch.setattr(
-        "battleship.ai.environment.record_game_metric",
-        lambda name, value, attrs=None: metrics.append(name),
+def test_environment_records_telemetry(
+    monkeypatch: pytest.MonkeyPatch, telemetry_spy: TelemetrySpy, telemetry_env: BattleshipEnv
+) -> None:
+    telemetry_spy.attach(
+        environment_module, tracer_attr="get_otel_tracer", logger_attr="get_otel_logger"
     )
+    monkeypatch.setattr(environment_module, "logger", telemetry_spy.logger)
+    tracer = telemetry_spy.tracer
+    env = telemetry_env
+    monkeypatch.setattr(env, "_tracer", tracer)
 
-    env = BattleshipEnv(rng_seed=3)
     observation, info = env.reset()
     assert observation.shape == env.observation_space.shape
     assert "battleship.env.reset" in tracer.span_names
 
     tracer.span_names.clear()
     action_mask = info["action_mask"]
-    first_action = int(np.flatnonzero(action_mask)[0])
+    first_action = int(action_mask.argmax())
+    assert action_mask[first_action], "argmax of an all-zero mask would pick an illegal cell"
     env.step(first_action)
     assert "battleship.env.step" in tracer.span_names
-    assert "battleship_env_actions_total" in metrics
+    assert "battleship_env_actions_total" in telemetry_spy.metric_counts